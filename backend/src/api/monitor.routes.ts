@@ -1,5 +1,6 @@
 import { Router, Request, Response } from 'express';
 import { getMonitorService } from '../services/MonitorService';
+import { getCallAnalyticsService } from '../services/CallAnalyticsService';
 import { env } from '../config/env';
 
 const router = Router();
@@ -124,6 +125,23 @@ router.get('/sessions/:callId/transcript', (req: Request, res: Response) => {
   }
 });
 
+/**
+ * GET /api/monitor/summaries/:callId?source=monitor|voicebot
+ * Get the post-call summary (available once the analytics batch has completed)
+ */
+router.get('/summaries/:callId', async (req: Request, res: Response) => {
+  const { callId } = req.params;
+  const source = req.query.source === 'voicebot' ? 'voicebot' : 'monitor';
+  const summary = await getCallAnalyticsService().getCallSummary(callId, source);
+
+  if (!summary) {
+    res.status(404).json({ error: `No summary for call ${callId} (yet)` });
+    return;
+  }
+
+  res.json(summary);
+});
+
 /**
  * DELETE /api/monitor/sessions/:callId
  * Terminate a specific monitoring session
@@ -23,6 +23,11 @@ const envSchema = z.object({
 
   // OpenAI (only required when AI_PROVIDER=openai)
   OPENAI_API_KEY: z.string().optional(),
+  OPENAI_MAX_CONCURRENCY: z.coerce.number().int().positive().default(16), // Requests in flight across all calls
+  OPENAI_RPM: z.coerce.number().int().positive().default(500), // Requests per minute
+  OPENAI_TPM: z.coerce.number().int().positive().default(200000), // LLM tokens per minute
+  OPENAI_MAX_ATTEMPTS: z.coerce.number().int().positive().default(2), // Per live STT/LLM/TTS request, incl. the first
+  OPENAI_MAX_RETRY_DELAY_MS: z.coerce.number().int().nonnegative().default(1000), // Backoff cap for live requests
 
   // Local LLM (only required when AI_PROVIDER=local-llm)
   LOCAL_LLM_URL: z.string().url().optional(),
@@ -35,12 +40,19 @@ const envSchema = z.object({
   STT_WHISPER_ENABLED: z.coerce.boolean().default(false),
   STT_WHISPER_URL: z.string().url().optional().default('http://localhost:8000'),
   STT_WHISPER_MODEL: z.string().optional().default('Systran/faster-whisper-large-v3'),
+  STT_WHISPER_FALLBACK: z.string().optional(), // e.g. 'openai': retry there if the local server fails
 
   // TTS Providers
   TTS_OPENAI_ENABLED: z.coerce.boolean().default(true),
   TTS_COQUI_ENABLED: z.coerce.boolean().default(false),
   TTS_COQUI_URL: z.string().url().optional().default('http://localhost:5002'),
   TTS_COQUI_VOICE: z.string().optional().default('thorsten'),
+  TTS_PIPER_ENABLED: z.coerce.boolean().default(false),
+  TTS_PIPER_URL: z.string().url().optional().default('http://localhost:5000'),
+  TTS_PIPER_VOICE: z.string().optional(), // e.g. 'de_DE-thorsten-medium' (server default if omitted)
+  TTS_PIPER_SAMPLE_RATE: z.coerce.number().int().positive().default(22050), // 22050 for medium voices
+  TTS_CACHE_DIR: z.string().optional(), // Persist cached prompt audio (e.g. greeting) across restarts
+  TTS_CACHE_ENTRIES: z.coerce.number().int().positive().default(128), // In-memory cache size
 
   // LLM Providers
   LLM_OPENAI_ENABLED: z.coerce.boolean().default(true),
@@ -86,6 +98,17 @@ const envSchema = z.object({
   VAD_MIN_UTTERANCE_MS: z.coerce.number().int().positive().default(300),
   VAD_MAX_UTTERANCE_MS: z.coerce.number().int().positive().optional(), // Optional: Max utterance duration
 
+  // ===== Call Analytics (OpenAI Batch API) =====
+  CALL_ANALYTICS_ENABLED: z.coerce.boolean().default(false), // Post-call summaries
+  CALL_ANALYTICS_DIR: z.string().optional(), // Default: <WORKSHOP_DATA_DIR>/call-analytics
+  CALL_ANALYTICS_FLUSH_MINUTES: z.coerce.number().int().positive().default(15), // Batch submit/poll interval
+  CALL_ANALYTICS_MODEL: z.string().default('gpt-4o-mini'),
+
+  // ===== Monitor Configuration =====
+  MONITOR_STREAMING_TRANSCRIPTION: z.coerce.boolean().default(false), // Partial transcripts (LocalAgreement-2)
+  MONITOR_STREAMING_STEP_MS: z.coerce.number().int().positive().default(500), // Re-transcribe interval
+  MONITOR_STREAMING_BUFFER_MS: z.coerce.number().int().positive().default(15000), // Max audio per decode
+
   // ===== Denoiser Configuration =====
   DENOISER_RNNOISE_ENABLED: z.coerce.boolean().default(false),
   DENOISER_RNNOISE_QUALITY: z.enum(['low', 'medium', 'high']).default('medium'),
@@ -0,0 +1,16 @@
+/**
+ * Runtime Tuning
+ *
+ * Must be the first import of the entry point: libuv sizes its threadpool
+ * when it is used for the first time, so this has to run before any other
+ * module touches fs, dns, crypto or zlib.
+ *
+ * The threadpool serves DNS lookups for every outgoing AI API request as well
+ * as file and crypto work (TTS cache, hashing). The default of 4 threads
+ * becomes a queue with many concurrent calls.
+ */
+
+// Explicit setting from the shell/container wins (.env is not loaded yet at this point)
+process.env.UV_THREADPOOL_SIZE ??= '16';
+
+export {};
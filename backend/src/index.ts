@@ -5,6 +5,8 @@
  * Provides WebSocket and REST endpoints for workshop clients.
  */
 
+// Must run before anything else initializes the libuv threadpool
+import './config/runtime';
 import express from 'express';
 import { createServer } from 'http';
 import { Server as SocketIOServer } from 'socket.io';
@@ -20,6 +22,7 @@ import sipRoutes from './api/sip.routes';
 import monitorRoutes from './api/monitor.routes';
 import { getSIPVoiceService } from './services/SIPVoiceService';
 import { getMonitorService } from './services/MonitorService';
+import { getCallAnalyticsService } from './services/CallAnalyticsService';
 
 // Create Express app
 const app = express();
@@ -144,7 +147,17 @@ httpServer.listen(PORT, async () => {
   console.log(`   POST /api/sip/start        - Start SIP service`);
   console.log(`   GET  /api/monitor/status   - Monitor service status`);
   console.log(`   GET  /api/monitor/sessions - Active monitor sessions`);
-  console.log(`   POST /api/monitor/start    - Start monitor service\n`);
+  console.log(`   POST /api/monitor/start    - Start monitor service`);
+  console.log(`   GET  /api/monitor/summaries/:callId - Post-call summary\n`);
+
+  // Post-call summaries via the OpenAI Batch API
+  if (env.CALL_ANALYTICS_ENABLED) {
+    try {
+      await getCallAnalyticsService().start();
+    } catch (error) {
+      console.error('❌ Failed to start call analytics:', error);
+    }
+  }
 
   // Auto-start SIP service based on mode
   if (env.SIP_ENABLED) {
@@ -209,15 +222,76 @@ httpServer.listen(PORT, async () => {
   console.log('\n🎯 Ready for workshop! Connect clients to ws://localhost:' + PORT);
 });
 
-// Cleanup on shutdown
-process.on('SIGINT', async () => {
-  console.log('\n\n🛑 Shutting down gracefully...');
+// Periodic cleanup (every hour)
+const cleanupInterval = setInterval(() => {
+  const cleaned = sessionManager.cleanupInactiveSessions();
+  if (cleaned > 0) {
+    console.log(`🧹 Periodic cleanup: removed ${cleaned} inactive sessions`);
+  }
+}, 3600000);
+
+// Cleanup on shutdown (a second signal while shutting down is ignored)
+let shutdownPromise: Promise<void> | null = null;
+
+const SHUTDOWN_TIMEOUT_MS = 10000;
+const SERVICES_STOP_TIMEOUT_MS = 6000; // The rest is left for writing call analytics
+
+/**
+ * Wait for a shutdown step, but give up after timeoutMs so later steps still run
+ */
+async function withTimeout(step: Promise<void>, timeoutMs: number, name: string): Promise<void> {
+  let timer: NodeJS.Timeout | undefined;
+  const timeout = new Promise<void>((resolve) => {
+    timer = setTimeout(() => {
+      console.warn(`⚠️  ${name} did not stop within ${timeoutMs}ms, continuing shutdown`);
+      resolve();
+    }, timeoutMs);
+  });
+  try {
+    await Promise.race([step, timeout]);
+  } finally {
+    clearTimeout(timer);
+  }
+}
+
+async function shutdown(signal: string): Promise<void> {
+  console.log(`\n\n🛑 ${signal} received, shutting down gracefully...`);
+  clearInterval(cleanupInterval);
+  const deadline = Date.now() + SHUTDOWN_TIMEOUT_MS;
+
+  // Don't hang forever on stuck calls or keep-alive connections
+  setTimeout(() => {
+    console.error('❌ Shutdown timed out, forcing exit');
+    process.exit(1);
+  }, SHUTDOWN_TIMEOUT_MS).unref();
 
-  // Stop SIP service
+  // Stop SIP services (voice bot and/or monitor, depending on SIP_MODE)
+  // Both queue the transcripts of their active calls for analytics
   if (env.SIP_ENABLED) {
+    const stops: Promise<void>[] = [];
+
     const sipService = getSIPVoiceService();
-    await sipService.stop();
-    console.log('✅ SIP service stopped');
+    if (sipService.isRunning()) {
+      stops.push(sipService.stop().then(() => console.log('✅ SIP service stopped')));
+    }
+
+    const monitorService = getMonitorService();
+    if (monitorService.isRunning()) {
+      stops.push(monitorService.stop().then(() => console.log('✅ Monitor service stopped')));
+    }
+
+    await withTimeout(Promise.all(stops).then(() => undefined), SERVICES_STOP_TIMEOUT_MS, 'SIP services');
+  }
+
+  // After the services, so the transcripts they queued (including active calls) are written to disk
+  // Uses the time left before the forced exit, minus a second for closing the server
+  const analyticsService = getCallAnalyticsService();
+  if (analyticsService.isRunning()) {
+    await withTimeout(
+      analyticsService.stop().then(() => console.log('✅ Call analytics stopped')),
+      Math.max(deadline - Date.now() - 1000, 0),
+      'Call analytics'
+    );
   }
 
   // Disconnect all sessions
@@ -228,12 +302,13 @@ process.on('SIGINT', async () => {
     console.log('✅ Server closed');
     process.exit(0);
   });
-});
+}
 
-// Periodic cleanup (every hour)
-setInterval(() => {
-  const cleaned = sessionManager.cleanupInactiveSessions();
-  if (cleaned > 0) {
-    console.log(`🧹 Periodic cleanup: removed ${cleaned} inactive sessions`);
-  }
-}, 3600000);
+for (const signal of ['SIGINT', 'SIGTERM'] as const) {
+  process.on(signal, () => {
+    shutdownPromise ??= shutdown(signal).catch((error) => {
+      console.error('❌ Error during shutdown:', error);
+      process.exit(1);
+    });
+  });
+}
@@ -12,14 +12,17 @@ import { OpenAIProvider } from './ai/OpenAIProvider';
 import { LocalLLMProvider } from './ai/LocalLLMProvider';
 import { TeniosProvider } from './telephony/TeniosProvider';
 import { ProviderRegistry } from './ProviderRegistry';
+import { RequestScheduler } from './ai/RequestScheduler';
 
 // STT Providers
 import { OpenAISTTProvider } from './ai/stt/OpenAISTTProvider';
 import { FasterWhisperProvider } from './ai/stt/FasterWhisperProvider';
+import { FallbackSTTProvider } from './ai/stt/FallbackSTTProvider';
 
 // TTS Providers
 import { OpenAITTSProvider } from './ai/tts/OpenAITTSProvider';
 import { CoquiTTSProvider } from './ai/tts/CoquiTTSProvider';
+import { PiperTTSProvider } from './ai/tts/PiperTTSProvider';
 
 // LLM Providers
 import { OpenAILLMProvider } from './ai/llm/OpenAILLMProvider';
@@ -28,6 +31,28 @@ import { OllamaLLMProvider } from './ai/llm/OllamaLLMProvider';
 // Denoiser Providers
 import { NullDenoiserProvider, RNNoiseProvider, DTLNProvider } from './audio/denoiser';
 
+let openAIScheduler: RequestScheduler | null = null;
+
+/**
+ * Get the process-wide scheduler for OpenAI requests
+ * Shared by all registries so rate limits apply across all calls
+ * Requests serve live calls, so retries are kept short: a caller waiting
+ * for an answer is better served by a fallback than by a long backoff
+ */
+export function getOpenAIScheduler(): RequestScheduler {
+  if (!openAIScheduler) {
+    openAIScheduler = new RequestScheduler({
+      maxConcurrency: env.OPENAI_MAX_CONCURRENCY,
+      requestsPerMinute: env.OPENAI_RPM,
+      tokensPerMinute: env.OPENAI_TPM,
+      maxAttempts: env.OPENAI_MAX_ATTEMPTS,
+      minRetryDelayMs: Math.min(250, env.OPENAI_MAX_RETRY_DELAY_MS),
+      maxRetryDelayMs: env.OPENAI_MAX_RETRY_DELAY_MS
+    });
+  }
+  return openAIScheduler;
+}
+
 /**
  * Create Provider Registry with all enabled providers
  */
@@ -36,18 +61,26 @@ export function createProviderRegistry(): ProviderRegistry {
 
   // ===== STT Providers =====
   if (env.STT_OPENAI_ENABLED && env.OPENAI_API_KEY) {
-    registry.registerSTT('openai', new OpenAISTTProvider(env.OPENAI_API_KEY));
+    registry.registerSTT('openai', new OpenAISTTProvider(env.OPENAI_API_KEY, getOpenAIScheduler()));
   }
   if (env.STT_WHISPER_ENABLED && env.STT_WHISPER_URL) {
-    registry.registerSTT('whisper', new FasterWhisperProvider(
-      env.STT_WHISPER_URL,
-      env.STT_WHISPER_MODEL
-    ));
+    const whisper = new FasterWhisperProvider(env.STT_WHISPER_URL, env.STT_WHISPER_MODEL);
+    const fallbackName = env.STT_WHISPER_FALLBACK;
+
+    // Local faster-whisper first, hosted provider only if the local server fails
+    if (fallbackName && fallbackName !== 'whisper' && registry.hasSTT(fallbackName)) {
+      registry.registerSTT(
+        'whisper',
+        new FallbackSTTProvider(whisper, registry.getSTT(fallbackName))
+      );
+    } else {
+      registry.registerSTT('whisper', whisper);
+    }
   }
 
   // ===== TTS Providers =====
   if (env.TTS_OPENAI_ENABLED && env.OPENAI_API_KEY) {
-    registry.registerTTS('openai', new OpenAITTSProvider(env.OPENAI_API_KEY));
+    registry.registerTTS('openai', new OpenAITTSProvider(env.OPENAI_API_KEY, getOpenAIScheduler()));
   }
   if (env.TTS_COQUI_ENABLED && env.TTS_COQUI_URL) {
     registry.registerTTS('coqui', new CoquiTTSProvider(
@@ -55,10 +88,17 @@ export function createProviderRegistry(): ProviderRegistry {
       env.TTS_COQUI_VOICE
     ));
   }
+  if (env.TTS_PIPER_ENABLED && env.TTS_PIPER_URL) {
+    registry.registerTTS('piper', new PiperTTSProvider(
+      env.TTS_PIPER_URL,
+      env.TTS_PIPER_VOICE,
+      env.TTS_PIPER_SAMPLE_RATE
+    ));
+  }
 
   // ===== LLM Providers =====
   if (env.LLM_OPENAI_ENABLED && env.OPENAI_API_KEY) {
-    registry.registerLLM('openai', new OpenAILLMProvider(env.OPENAI_API_KEY));
+    registry.registerLLM('openai', new OpenAILLMProvider(env.OPENAI_API_KEY, getOpenAIScheduler()));
   }
   if (env.LLM_OLLAMA_ENABLED && env.LLM_OLLAMA_URL) {
     registry.registerLLM('ollama', new OllamaLLMProvider(
@@ -136,7 +176,7 @@ export function createAIProvider(): IAIProvider {
     if (!env.OPENAI_API_KEY) {
       throw new Error('OPENAI_API_KEY is required when AI_PROVIDER=openai');
     }
-    return new OpenAIProvider(env.OPENAI_API_KEY);
+    return new OpenAIProvider(env.OPENAI_API_KEY, getOpenAIScheduler());
   }
 
   if (env.AI_PROVIDER === 'local-llm') {
@@ -14,13 +14,20 @@ export interface TranscribeOptions {
   language: string;
   model?: string;
   provider?: string;  // 'openai' | 'whisper'
+  sampleRate?: number;  // Set if audio is raw 16-bit mono PCM instead of WAV
+}
+
+export interface TranscribedWord {
+  word: string;
+  start: number;  // Seconds from the start of the audio
+  end: number;
 }
 
 export interface SynthesizeOptions {
   voice: string;
   language: string;
   speed?: number;
-  provider?: string;  // 'openai' | 'coqui'
+  provider?: string;  // 'openai' | 'coqui' | 'piper'
 }
 
 export interface ChatOptions {
@@ -20,6 +20,15 @@ export interface ILLMProvider {
    */
   chat(messages: ChatMessage[], options?: ChatOptions): Promise<string>;
 
+  /**
+   * Stream a chat completion token by token (optional)
+   * Lets callers act on the first words before the full response is generated
+   * @param messages - Conversation history
+   * @param options - Chat options (systemPrompt, temperature, maxTokens, model)
+   * @returns Response text deltas in generation order
+   */
+  chatStream?(messages: ChatMessage[], options?: ChatOptions): AsyncIterable<string>;
+
   /**
    * Extract structured information from text
    * Helper for extracting customer numbers, meter readings, etc.
@@ -4,7 +4,7 @@
  * Abstraction for STT services like OpenAI Whisper, faster-whisper, etc.
  */
 
-import type { TranscribeOptions } from './IAIProvider';
+import type { TranscribeOptions, TranscribedWord } from './IAIProvider';
 
 export interface ISTTProvider {
   /**
@@ -19,4 +19,12 @@ export interface ISTTProvider {
    * @returns Transcribed text
    */
   transcribe(audioBuffer: Buffer, options: TranscribeOptions): Promise<string>;
+
+  /**
+   * Transcribe audio to words with timestamps (optional, required for streaming transcription)
+   * @param audioBuffer - Audio data as Buffer
+   * @param options - Transcription options (language, model)
+   * @returns Transcribed words in order
+   */
+  transcribeWords?(audioBuffer: Buffer, options: TranscribeOptions): Promise<TranscribedWord[]>;
 }
@@ -12,6 +12,12 @@ export interface ITTSProvider {
    */
   readonly name: string;
 
+  /**
+   * Voice configuration of the provider itself (e.g. configured voice model) that
+   * changes the audio beyond SynthesizeOptions - part of TTS cache keys
+   */
+  readonly voiceId?: string;
+
   /**
    * Synthesize text to audio
    * @param text - Text to convert to speech
@@ -19,4 +25,18 @@ export interface ITTSProvider {
    * @returns Audio data as Buffer
    */
   synthesize(text: string, options: SynthesizeOptions): Promise<Buffer>;
+
+  /**
+   * Sample rate of the raw PCM yielded by synthesizeStream()
+   */
+  readonly streamSampleRate?: number;
+
+  /**
+   * Stream synthesized speech as raw 16-bit mono PCM (optional)
+   * Allows playback to start before synthesis has finished
+   * @param text - Text to convert to speech
+   * @param options - Synthesis options (voice, language, speed)
+   * @returns PCM chunks (little-endian) at streamSampleRate
+   */
+  synthesizeStream?(text: string, options: SynthesizeOptions): AsyncIterable<Buffer>;
 }
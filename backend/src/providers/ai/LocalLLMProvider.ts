@@ -18,6 +18,7 @@ import type {
   ChatOptions,
   ExtractedInfo
 } from './IAIProvider';
+import { wavParts } from '../../sip/AudioUtils';
 
 export class LocalLLMProvider implements IAIProvider {
   readonly name = 'LocalLLM';
@@ -42,7 +43,7 @@ export class LocalLLMProvider implements IAIProvider {
   async transcribe(audioBuffer: Buffer, options: TranscribeOptions): Promise<string> {
     try {
       const formData = new FormData();
-      formData.append('file', new Blob([audioBuffer]), 'audio.wav');
+      formData.append('file', new Blob(wavParts(audioBuffer, options.sampleRate)), 'audio.wav');
       formData.append('language', options.language);
 
       const response = await fetch(`${this.whisperUrl}/inference`, {
@@ -7,7 +7,9 @@
  * - LLM: GPT-4
  */
 
-import OpenAI from 'openai';
+import type OpenAI from 'openai';
+import { getOpenAIClient } from './openaiClient';
+import { RequestScheduler, estimateTokens } from './RequestScheduler';
 import type {
   IAIProvider,
   ChatMessage,
@@ -16,13 +18,16 @@ import type {
   ChatOptions,
   ExtractedInfo
 } from './IAIProvider';
+import { wavParts } from '../../sip/AudioUtils';
 
 export class OpenAIProvider implements IAIProvider {
   readonly name = 'OpenAI';
   private client: OpenAI;
+  private scheduler: RequestScheduler;
 
-  constructor(apiKey: string) {
-    this.client = new OpenAI({ apiKey });
+  constructor(apiKey: string, scheduler: RequestScheduler = new RequestScheduler()) {
+    this.client = getOpenAIClient(apiKey);
+    this.scheduler = scheduler;
   }
 
   /**
@@ -30,16 +35,20 @@ export class OpenAIProvider implements IAIProvider {
    */
   async transcribe(audioBuffer: Buffer, options: TranscribeOptions): Promise<string> {
     try {
-      const file = new File([audioBuffer], 'audio.wav', { type: 'audio/wav' });
+      const file = new File(wavParts(audioBuffer, options.sampleRate), 'audio.wav', {
+        type: 'audio/wav'
+      });
 
       // Convert BCP-47 language code (de-DE) to ISO-639-1 (de) for Whisper API
       const language = options.language?.split('-')[0]?.toLowerCase();
 
-      const transcription = await this.client.audio.transcriptions.create({
-        file: file,
-        model: options.model || 'whisper-1',
-        language: language
-      });
+      const transcription = await this.scheduler.submit(() =>
+        this.client.audio.transcriptions.create({
+          file: file,
+          model: options.model || 'whisper-1',
+          language: language
+        })
+      );
 
       return transcription.text;
     } catch (error) {
@@ -56,13 +65,15 @@ export class OpenAIProvider implements IAIProvider {
       // Strip SSML tags as OpenAI doesn't support them
       const cleanText = text.replace(/<[^>]*>/g, '').trim();
 
-      const mp3 = await this.client.audio.speech.create({
-        model: 'gpt-4o-mini-tts',
-        voice: options.voice as any, // 'alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer'
-        input: cleanText,
-        response_format: 'mp3',
-        speed: options.speed || 1.0
-      });
+      const mp3 = await this.scheduler.submit(() =>
+        this.client.audio.speech.create({
+          model: 'gpt-4o-mini-tts',
+          voice: options.voice as any, // 'alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer'
+          input: cleanText,
+          response_format: 'mp3',
+          speed: options.speed || 1.0
+        })
+      );
 
       const buffer = Buffer.from(await mp3.arrayBuffer());
       return buffer;
@@ -83,12 +94,16 @@ export class OpenAIProvider implements IAIProvider {
 
       const allMessages = systemMessage ? [systemMessage, ...messages] : messages;
 
-      const completion = await this.client.chat.completions.create({
-        model: options?.model || 'gpt-4o-mini',
-        messages: allMessages,
-        temperature: options?.temperature ?? 0.7,
-        max_tokens: options?.maxTokens ?? 150
-      });
+      const completion = await this.scheduler.submit(
+        () =>
+          this.client.chat.completions.create({
+            model: options?.model || 'gpt-4o-mini',
+            messages: allMessages,
+            temperature: options?.temperature ?? 0.7,
+            max_tokens: options?.maxTokens ?? 150
+          }),
+        estimateTokens(allMessages.map((m) => m.content).join('')) + (options?.maxTokens ?? 150)
+      );
 
       const response = completion.choices[0]?.message?.content || '';
       return response;
@@ -119,15 +134,19 @@ Antworte im JSON-Format:
 
 Wenn keine Information erkennbar ist, setze den Wert auf null.`;
 
-      const completion = await this.client.chat.completions.create({
-        model: 'gpt-4o-mini',
-        messages: [
-          { role: 'system', content: systemPrompt },
-          { role: 'user', content: text }
-        ],
-        temperature: 0.3,
-        max_tokens: 100
-      });
+      const completion = await this.scheduler.submit(
+        () =>
+          this.client.chat.completions.create({
+            model: 'gpt-4o-mini',
+            messages: [
+              { role: 'system', content: systemPrompt },
+              { role: 'user', content: text }
+            ],
+            temperature: 0.3,
+            max_tokens: 100
+          }),
+        estimateTokens(systemPrompt + text) + 100
+      );
 
       const responseText = completion.choices[0]?.message?.content?.trim() || '{}';
 
@@ -0,0 +1,194 @@
+/**
+ * Request Scheduler
+ *
+ * Central gate for outgoing AI API requests. With many simultaneous calls,
+ * every pipeline fires STT/LLM/TTS requests independently, which easily
+ * exceeds the provider's rate limits and causes 429 retry storms.
+ *
+ * The scheduler smooths this into steady throughput:
+ * - Token buckets for requests per minute (RPM) and tokens per minute (TPM)
+ * - Bounded number of concurrent requests
+ * - Retry with jittered exponential backoff on rate limit, connection and
+ *   transient server errors (5xx, 408, 409 - the same set the SDK retries)
+ *
+ * The default retry schedule (6 attempts, 1-30s backoff) suits background
+ * work. Schedulers serving live calls should configure a short budget.
+ */
+
+import OpenAI from 'openai';
+
+export interface RequestSchedulerOptions {
+  /**
+   * Maximum number of requests in flight (default: unlimited)
+   */
+  maxConcurrency?: number;
+
+  /**
+   * Requests per minute (default: unlimited)
+   */
+  requestsPerMinute?: number;
+
+  /**
+   * Tokens per minute (default: unlimited)
+   */
+  tokensPerMinute?: number;
+
+  /**
+   * Attempts per request including the first one (default: 6)
+   */
+  maxAttempts?: number;
+
+  /**
+   * Backoff bounds in ms (default: 1000 - 30000)
+   */
+  minRetryDelayMs?: number;
+  maxRetryDelayMs?: number;
+}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Rough token estimate for rate limiting (~4 characters per token)
+ */
+export function estimateTokens(text: string): number {
+  return Math.ceil(text.length / 4);
+}
+
+/**
+ * Continuously refilling token bucket (capacity refills once per minute)
+ * An unlimited (Infinity) capacity never blocks
+ */
+class TokenBucket {
+  private tokens: number;
+  private lastRefill: number = Date.now();
+
+  constructor(private capacity: number) {
+    this.tokens = capacity;
+  }
+
+  async take(amount: number): Promise<void> {
+    // Refill arithmetic with Infinity yields NaN (0 * Infinity), which would wait forever
+    if (!Number.isFinite(this.capacity)) {
+      return;
+    }
+
+    // A single request larger than the bucket would wait forever
+    const needed = Math.min(amount, this.capacity);
+
+    for (;;) {
+      this.refill();
+      if (this.tokens >= needed) {
+        this.tokens -= needed;
+        return;
+      }
+      const waitMs = ((needed - this.tokens) * 60000) / this.capacity;
+      await sleep(Math.ceil(waitMs));
+    }
+  }
+
+  private refill(): void {
+    const now = Date.now();
+    const refill = ((now - this.lastRefill) * this.capacity) / 60000;
+    this.tokens = Math.min(this.capacity, this.tokens + refill);
+    this.lastRefill = now;
+  }
+}
+
+export class RequestScheduler {
+  private readonly maxConcurrency: number;
+  private readonly maxAttempts: number;
+  private readonly minRetryDelayMs: number;
+  private readonly maxRetryDelayMs: number;
+  private readonly requestBucket: TokenBucket;
+  private readonly tokenBucket: TokenBucket;
+
+  private active: number = 0;
+  private waiters: (() => void)[] = [];
+
+  constructor(options: RequestSchedulerOptions = {}) {
+    this.maxConcurrency = options.maxConcurrency ?? Infinity;
+    this.maxAttempts = options.maxAttempts ?? 6;
+    this.minRetryDelayMs = options.minRetryDelayMs ?? 1000;
+    this.maxRetryDelayMs = options.maxRetryDelayMs ?? 30000;
+    this.requestBucket = new TokenBucket(options.requestsPerMinute ?? Infinity);
+    this.tokenBucket = new TokenBucket(options.tokensPerMinute ?? Infinity);
+  }
+
+  /**
+   * Run a request once rate limits and concurrency allow it
+   * @param task - Factory creating the request (called again on retry)
+   * @param tokenEstimate - Estimated tokens consumed (0 for non-token APIs like Whisper)
+   */
+  async submit<T>(task: () => Promise<T>, tokenEstimate: number = 0): Promise<T> {
+    for (let attempt = 1; ; attempt++) {
+      await this.requestBucket.take(1);
+      if (tokenEstimate > 0) {
+        await this.tokenBucket.take(tokenEstimate);
+      }
+
+      await this.acquire();
+      let delayMs = 0;
+      try {
+        return await task();
+      } catch (error) {
+        if (attempt >= this.maxAttempts || !this.isRetryable(error)) {
+          throw error;
+        }
+        delayMs = this.getRetryDelay(attempt);
+        console.warn(
+          `[RequestScheduler] ${error instanceof Error ? error.message : error} - retrying in ${delayMs}ms (attempt ${attempt}/${this.maxAttempts})`
+        );
+      } finally {
+        this.release();
+      }
+
+      await sleep(delayMs);
+    }
+  }
+
+  /**
+   * Get scheduler statistics
+   */
+  getStats(): { active: number; queued: number } {
+    return { active: this.active, queued: this.waiters.length };
+  }
+
+  private isRetryable(error: unknown): boolean {
+    // APIConnectionTimeoutError extends APIConnectionError
+    if (
+      error instanceof OpenAI.RateLimitError ||
+      error instanceof OpenAI.APIConnectionError ||
+      error instanceof OpenAI.InternalServerError
+    ) {
+      return true;
+    }
+    // Request timeout / lock conflict
+    return error instanceof OpenAI.APIError && (error.status === 408 || error.status === 409);
+  }
+
+  /**
+   * Random exponential backoff: uniform in [0, min(max, min * 2^attempt)]
+   */
+  private getRetryDelay(attempt: number): number {
+    const ceiling = Math.min(this.maxRetryDelayMs, this.minRetryDelayMs * 2 ** attempt);
+    return Math.round(Math.random() * ceiling);
+  }
+
+  private async acquire(): Promise<void> {
+    if (this.active < this.maxConcurrency) {
+      this.active++;
+      return;
+    }
+    // Slot is handed over directly by release()
+    await new Promise<void>((resolve) => this.waiters.push(resolve));
+  }
+
+  private release(): void {
+    const next = this.waiters.shift();
+    if (next) {
+      next();
+    } else {
+      this.active--;
+    }
+  }
+}
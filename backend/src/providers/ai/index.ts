@@ -5,7 +5,7 @@
  */
 
 // Interfaces
-export type { IAIProvider, ChatMessage, TranscribeOptions, SynthesizeOptions, ChatOptions, ExtractedInfo } from './IAIProvider';
+export type { IAIProvider, ChatMessage, TranscribeOptions, TranscribedWord, SynthesizeOptions, ChatOptions, ExtractedInfo } from './IAIProvider';
 export type { ISTTProvider } from './ISTTProvider';
 export type { ITTSProvider } from './ITTSProvider';
 export type { ILLMProvider } from './ILLMProvider';
@@ -18,10 +18,12 @@ export { CompositeAIProvider } from './CompositeAIProvider';
 // STT Providers
 export { OpenAISTTProvider } from './stt/OpenAISTTProvider';
 export { FasterWhisperProvider } from './stt/FasterWhisperProvider';
+export { FallbackSTTProvider } from './stt/FallbackSTTProvider';
 
 // TTS Providers
 export { OpenAITTSProvider } from './tts/OpenAITTSProvider';
 export { CoquiTTSProvider } from './tts/CoquiTTSProvider';
+export { PiperTTSProvider } from './tts/PiperTTSProvider';
 
 // LLM Providers
 export { OpenAILLMProvider } from './llm/OpenAILLMProvider';
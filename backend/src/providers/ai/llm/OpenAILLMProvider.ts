@@ -4,16 +4,20 @@
  * Uses OpenAI GPT API for chat completions.
  */
 
-import OpenAI from 'openai';
+import type OpenAI from 'openai';
+import { getOpenAIClient } from '../openaiClient';
+import { RequestScheduler, estimateTokens } from '../RequestScheduler';
 import type { ILLMProvider } from '../ILLMProvider';
 import type { ChatMessage, ChatOptions, ExtractedInfo } from '../IAIProvider';
 
 export class OpenAILLMProvider implements ILLMProvider {
   readonly name = 'openai';
   private client: OpenAI;
+  private scheduler: RequestScheduler;
 
-  constructor(apiKey: string) {
-    this.client = new OpenAI({ apiKey });
+  constructor(apiKey: string, scheduler: RequestScheduler = new RequestScheduler()) {
+    this.client = getOpenAIClient(apiKey);
+    this.scheduler = scheduler;
   }
 
   async chat(messages: ChatMessage[], options?: ChatOptions): Promise<string> {
@@ -24,12 +28,16 @@ export class OpenAILLMProvider implements ILLMProvider {
 
       const allMessages = systemMessage ? [systemMessage, ...messages] : messages;
 
-      const completion = await this.client.chat.completions.create({
-        model: options?.model || 'gpt-4o-mini',
-        messages: allMessages,
-        temperature: options?.temperature ?? 0.7,
-        max_tokens: options?.maxTokens ?? 150
-      });
+      const completion = await this.scheduler.submit(
+        () =>
+          this.client.chat.completions.create({
+            model: options?.model || 'gpt-4o-mini',
+            messages: allMessages,
+            temperature: options?.temperature ?? 0.7,
+            max_tokens: options?.maxTokens ?? 150
+          }),
+        estimateTokens(allMessages.map((m) => m.content).join('')) + (options?.maxTokens ?? 150)
+      );
 
       const response = completion.choices[0]?.message?.content || '';
       return response;
@@ -39,6 +47,38 @@ export class OpenAILLMProvider implements ILLMProvider {
     }
   }
 
+  async *chatStream(messages: ChatMessage[], options?: ChatOptions): AsyncIterable<string> {
+    const systemMessage = options?.systemPrompt
+      ? { role: 'system' as const, content: options.systemPrompt }
+      : null;
+
+    const allMessages = systemMessage ? [systemMessage, ...messages] : messages;
+
+    const stream = await this.scheduler
+      .submit(
+        () =>
+          this.client.chat.completions.create({
+            model: options?.model || 'gpt-4o-mini',
+            messages: allMessages,
+            temperature: options?.temperature ?? 0.7,
+            max_tokens: options?.maxTokens ?? 150,
+            stream: true
+          }),
+        estimateTokens(allMessages.map((m) => m.content).join('')) + (options?.maxTokens ?? 150)
+      )
+      .catch((error) => {
+        console.error('[OpenAILLMProvider] Chat completion failed:', error);
+        throw new Error('Chat completion failed');
+      });
+
+    for await (const chunk of stream) {
+      const delta = chunk.choices[0]?.delta?.content;
+      if (delta) {
+        yield delta;
+      }
+    }
+  }
+
   async extractNumbers(text: string): Promise<ExtractedInfo> {
     try {
       const systemPrompt = `Du bist ein Assistent, der strukturierte Informationen aus gesprochenem Text extrahiert.
@@ -57,15 +97,19 @@ Antworte im JSON-Format:
 
 Wenn keine Information erkennbar ist, setze den Wert auf null.`;
 
-      const completion = await this.client.chat.completions.create({
-        model: 'gpt-4o-mini',
-        messages: [
-          { role: 'system', content: systemPrompt },
-          { role: 'user', content: text }
-        ],
-        temperature: 0.3,
-        max_tokens: 100
-      });
+      const completion = await this.scheduler.submit(
+        () =>
+          this.client.chat.completions.create({
+            model: 'gpt-4o-mini',
+            messages: [
+              { role: 'system', content: systemPrompt },
+              { role: 'user', content: text }
+            ],
+            temperature: 0.3,
+            max_tokens: 100
+          }),
+        estimateTokens(systemPrompt + text) + 100
+      );
 
       const responseText = completion.choices[0]?.message?.content?.trim() || '{}';
 
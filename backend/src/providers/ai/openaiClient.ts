@@ -0,0 +1,54 @@
+/**
+ * Shared OpenAI Client
+ *
+ * All OpenAI-based providers (STT, TTS, LLM) share one client per API key,
+ * backed by a keep-alive connection pool. Reusing connections saves a TCP +
+ * TLS handshake on every Whisper/chat/TTS request and keeps concurrent calls
+ * from opening a fresh pool per provider instance.
+ */
+
+import https from 'https';
+import OpenAI from 'openai';
+
+const clients = new Map<string, OpenAI>();
+
+let httpAgent: https.Agent | null = null;
+
+/**
+ * Get the shared keep-alive agent for OpenAI requests
+ */
+function getHttpAgent(): https.Agent {
+  if (!httpAgent) {
+    httpAgent = new https.Agent({
+      keepAlive: true,
+      maxSockets: 64,
+      maxFreeSockets: 32
+    });
+  }
+  return httpAgent;
+}
+
+/**
+ * Per-request options restoring the SDK's default retries (429, 5xx, 408, 409,
+ * connection errors) for requests that are not submitted via a RequestScheduler
+ */
+export const SDK_RETRY_OPTIONS = { maxRetries: 2 } as const;
+
+/**
+ * Get the shared OpenAI client for an API key (created lazily)
+ */
+export function getOpenAIClient(apiKey: string): OpenAI {
+  let client = clients.get(apiKey);
+  if (!client) {
+    client = new OpenAI({
+      apiKey,
+      httpAgent: getHttpAgent(),
+      timeout: 30000,
+      // Retries are handled by the RequestScheduler (with rate limiting); requests that
+      // bypass the scheduler must pass their own maxRetries (see SDK_RETRY_OPTIONS)
+      maxRetries: 0
+    });
+    clients.set(apiKey, client);
+  }
+  return client;
+}
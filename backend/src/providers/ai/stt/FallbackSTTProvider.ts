@@ -0,0 +1,56 @@
+/**
+ * Fallback STT Provider
+ *
+ * Wraps a primary STT provider (e.g. a local faster-whisper server) and
+ * retries with a fallback provider (e.g. OpenAI Whisper) if the primary fails.
+ * Keeps the low-latency local path as default without losing transcripts
+ * when the local server is down or overloaded.
+ */
+
+import type { ISTTProvider } from '../ISTTProvider';
+import type { TranscribeOptions, TranscribedWord } from '../IAIProvider';
+
+export class FallbackSTTProvider implements ISTTProvider {
+  readonly name: string;
+
+  // Only offered if both providers return word timestamps, so callers can feature-check it
+  transcribeWords?: (audioBuffer: Buffer, options: TranscribeOptions) => Promise<TranscribedWord[]>;
+
+  constructor(
+    private primary: ISTTProvider,
+    private fallback: ISTTProvider
+  ) {
+    this.name = primary.name;
+
+    const primaryWords = primary.transcribeWords?.bind(primary);
+    const fallbackWords = fallback.transcribeWords?.bind(fallback);
+    if (primaryWords && fallbackWords) {
+      this.transcribeWords = (audioBuffer, options) =>
+        this.withFallback(
+          () => primaryWords(audioBuffer, options),
+          // The fallback may expect its own default model
+          () => fallbackWords(audioBuffer, { ...options, model: undefined })
+        );
+    }
+  }
+
+  async transcribe(audioBuffer: Buffer, options: TranscribeOptions): Promise<string> {
+    return this.withFallback(
+      () => this.primary.transcribe(audioBuffer, options),
+      // The fallback may expect its own default model
+      () => this.fallback.transcribe(audioBuffer, { ...options, model: undefined })
+    );
+  }
+
+  private async withFallback<T>(primary: () => Promise<T>, fallback: () => Promise<T>): Promise<T> {
+    try {
+      return await primary();
+    } catch (error) {
+      console.warn(
+        `[FallbackSTTProvider] ${this.primary.name} failed, falling back to ${this.fallback.name}:`,
+        error instanceof Error ? error.message : error
+      );
+      return fallback();
+    }
+  }
+}
@@ -8,32 +8,65 @@
  */
 
 import type { ISTTProvider } from '../ISTTProvider';
-import type { TranscribeOptions } from '../IAIProvider';
+import type { TranscribeOptions, TranscribedWord } from '../IAIProvider';
+import { wavParts } from '../../../sip/AudioUtils';
 
 export class FasterWhisperProvider implements ISTTProvider {
   readonly name = 'whisper';
   private baseUrl: string;
   private defaultModel: string;
+  private timeoutMs: number;
 
   constructor(
     baseUrl: string = 'http://localhost:8000',
-    defaultModel: string = 'Systran/faster-whisper-large-v3'
+    defaultModel: string = 'Systran/faster-whisper-large-v3',
+    timeoutMs: number = 15000
   ) {
     this.baseUrl = baseUrl;
     this.defaultModel = defaultModel;
+    this.timeoutMs = timeoutMs;
   }
 
   async transcribe(audioBuffer: Buffer, options: TranscribeOptions): Promise<string> {
+    const result = await this.request(audioBuffer, options) as { text: string };
+    return result.text;
+  }
+
+  async transcribeWords(audioBuffer: Buffer, options: TranscribeOptions): Promise<TranscribedWord[]> {
+    const result = await this.request(audioBuffer, options, true) as {
+      words?: TranscribedWord[];
+    };
+    // Words carry a leading space in faster-whisper output
+    return (result.words ?? [])
+      .map(({ word, start, end }) => ({ word: word.trim(), start, end }))
+      .filter(({ word }) => word.length > 0);
+  }
+
+  /**
+   * Send the transcription request
+   * @param withWords - Request word timestamps (verbose_json)
+   */
+  private async request(
+    audioBuffer: Buffer,
+    options: TranscribeOptions,
+    withWords: boolean = false
+  ): Promise<unknown> {
     try {
       // faster-whisper-server uses OpenAI-compatible API
       const formData = new FormData();
-      formData.append('file', new Blob([audioBuffer]), 'audio.wav');
+      formData.append('file', new Blob(wavParts(audioBuffer, options.sampleRate)), 'audio.wav');
       formData.append('model', options.model || this.defaultModel);
       formData.append('language', options.language);
+      if (withWords) {
+        formData.append('response_format', 'verbose_json');
+        formData.append('timestamp_granularities[]', 'word');
+      }
 
       const response = await fetch(`${this.baseUrl}/v1/audio/transcriptions`, {
         method: 'POST',
-        body: formData
+        body: formData,
+        // Fail fast on a stuck local server so a fallback provider can take over
+        signal: AbortSignal.timeout(this.timeoutMs)
       });
 
       if (!response.ok) {
@@ -41,8 +74,7 @@ export class FasterWhisperProvider implements ISTTProvider {
         throw new Error(`FasterWhisper API error: ${response.status} ${response.statusText} - ${errorText}`);
       }
 
-      const result = await response.json() as { text: string };
-      return result.text;
+      return await response.json();
     } catch (error) {
       console.error('[FasterWhisperProvider] Transcription failed:', error);
       if (error instanceof Error && error.message.includes('FasterWhisper API error')) {
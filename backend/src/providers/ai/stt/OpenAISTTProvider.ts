@@ -4,32 +4,65 @@
  * Uses OpenAI Whisper API for speech-to-text.
  */
 
-import OpenAI from 'openai';
+import type OpenAI from 'openai';
+import { getOpenAIClient } from '../openaiClient';
+import { RequestScheduler } from '../RequestScheduler';
 import type { ISTTProvider } from '../ISTTProvider';
-import type { TranscribeOptions } from '../IAIProvider';
+import type { TranscribeOptions, TranscribedWord } from '../IAIProvider';
+import { wavParts } from '../../../sip/AudioUtils';
 
 export class OpenAISTTProvider implements ISTTProvider {
   readonly name = 'openai';
   private client: OpenAI;
+  private scheduler: RequestScheduler;
 
-  constructor(apiKey: string) {
-    this.client = new OpenAI({ apiKey });
+  constructor(apiKey: string, scheduler: RequestScheduler = new RequestScheduler()) {
+    this.client = getOpenAIClient(apiKey);
+    this.scheduler = scheduler;
   }
 
   async transcribe(audioBuffer: Buffer, options: TranscribeOptions): Promise<string> {
     try {
-      const file = new File([audioBuffer], 'audio.wav', { type: 'audio/wav' });
-
-      const transcription = await this.client.audio.transcriptions.create({
-        file: file,
-        model: options.model || 'whisper-1',
-        language: options.language
+      const file = new File(wavParts(audioBuffer, options.sampleRate), 'audio.wav', {
+        type: 'audio/wav'
       });
 
+      const transcription = await this.scheduler.submit(() =>
+        this.client.audio.transcriptions.create({
+          file: file,
+          model: options.model || 'whisper-1',
+          language: options.language
+        })
+      );
+
       return transcription.text;
     } catch (error) {
       console.error('[OpenAISTTProvider] Transcription failed:', error);
       throw new Error('Transcription failed');
     }
   }
+
+  async transcribeWords(audioBuffer: Buffer, options: TranscribeOptions): Promise<TranscribedWord[]> {
+    try {
+      const file = new File(wavParts(audioBuffer, options.sampleRate), 'audio.wav', {
+        type: 'audio/wav'
+      });
+
+      // Word timestamps are only available with verbose_json (whisper-1)
+      const transcription = await this.scheduler.submit(() =>
+        this.client.audio.transcriptions.create({
+          file: file,
+          model: options.model || 'whisper-1',
+          language: options.language,
+          response_format: 'verbose_json',
+          timestamp_granularities: ['word']
+        })
+      );
+
+      return (transcription.words ?? []).map(({ word, start, end }) => ({ word, start, end }));
+    } catch (error) {
+      console.error('[OpenAISTTProvider] Transcription failed:', error);
+      throw new Error('Transcription failed');
+    }
+  }
 }
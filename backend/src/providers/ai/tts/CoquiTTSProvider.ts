@@ -13,6 +13,7 @@ import type { SynthesizeOptions } from '../IAIProvider';
 
 export class CoquiTTSProvider implements ITTSProvider {
   readonly name = 'coqui';
+  readonly voiceId: string;
   private baseUrl: string;
   private defaultVoice: string;
 
@@ -22,6 +23,7 @@ export class CoquiTTSProvider implements ITTSProvider {
   ) {
     this.baseUrl = baseUrl;
     this.defaultVoice = defaultVoice;
+    this.voiceId = `${baseUrl}|${defaultVoice}`;
   }
 
   async synthesize(text: string, options: SynthesizeOptions): Promise<Buffer> {
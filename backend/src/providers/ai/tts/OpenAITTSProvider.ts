@@ -4,16 +4,24 @@
  * Uses OpenAI TTS API for text-to-speech.
  */
 
-import OpenAI from 'openai';
+import type OpenAI from 'openai';
+import { getOpenAIClient } from '../openaiClient';
+import { RequestScheduler } from '../RequestScheduler';
 import type { ITTSProvider } from '../ITTSProvider';
 import type { SynthesizeOptions } from '../IAIProvider';
 
+const TTS_MODEL = 'gpt-4o-mini-tts';
+
 export class OpenAITTSProvider implements ITTSProvider {
   readonly name = 'openai';
+  readonly streamSampleRate = 24000; // OpenAI 'pcm' format is fixed at 24kHz
+  readonly voiceId = TTS_MODEL;
   private client: OpenAI;
+  private scheduler: RequestScheduler;
 
-  constructor(apiKey: string) {
-    this.client = new OpenAI({ apiKey });
+  constructor(apiKey: string, scheduler: RequestScheduler = new RequestScheduler()) {
+    this.client = getOpenAIClient(apiKey);
+    this.scheduler = scheduler;
   }
 
   async synthesize(text: string, options: SynthesizeOptions): Promise<Buffer> {
@@ -21,13 +29,15 @@ export class OpenAITTSProvider implements ITTSProvider {
       // Strip SSML tags as OpenAI doesn't support them
       const cleanText = text.replace(/<[^>]*>/g, '').trim();
 
-      const mp3 = await this.client.audio.speech.create({
-        model: 'gpt-4o-mini-tts',
-        voice: options.voice as 'alloy' | 'echo' | 'fable' | 'onyx' | 'nova' | 'shimmer',
-        input: cleanText,
-        response_format: 'mp3',
-        speed: options.speed || 1.0
-      });
+      const mp3 = await this.scheduler.submit(() =>
+        this.client.audio.speech.create({
+          model: TTS_MODEL,
+          voice: options.voice as 'alloy' | 'echo' | 'fable' | 'onyx' | 'nova' | 'shimmer',
+          input: cleanText,
+          response_format: 'mp3',
+          speed: options.speed || 1.0
+        })
+      );
 
       const buffer = Buffer.from(await mp3.arrayBuffer());
       return buffer;
@@ -36,4 +46,33 @@ export class OpenAITTSProvider implements ITTSProvider {
       throw new Error('Speech synthesis failed');
     }
   }
+
+  async *synthesizeStream(text: string, options: SynthesizeOptions): AsyncIterable<Buffer> {
+    // Strip SSML tags as OpenAI doesn't support them
+    const cleanText = text.replace(/<[^>]*>/g, '').trim();
+
+    // Raw PCM skips the MP3 encode/decode round-trip entirely
+    const response = await this.scheduler
+      .submit(() =>
+        this.client.audio.speech.create({
+          model: TTS_MODEL,
+          voice: options.voice as 'alloy' | 'echo' | 'fable' | 'onyx' | 'nova' | 'shimmer',
+          input: cleanText,
+          response_format: 'pcm',
+          speed: options.speed || 1.0
+        })
+      )
+      .catch((error) => {
+        console.error('[OpenAITTSProvider] Speech synthesis failed:', error);
+        throw new Error('Speech synthesis failed');
+      });
+
+    if (!response.body) {
+      throw new Error('Speech synthesis failed: empty response body');
+    }
+
+    for await (const chunk of response.body as unknown as AsyncIterable<Uint8Array>) {
+      yield Buffer.from(chunk.buffer, chunk.byteOffset, chunk.byteLength);
+    }
+  }
 }
@@ -0,0 +1,155 @@
+/**
+ * Piper TTS Provider
+ *
+ * Uses a self-hosted Piper HTTP server (ONNX voices, runs faster than
+ * real time on CPU) for text-to-speech without a cloud round trip.
+ * @see https://github.com/OHF-Voice/piper1-gpl
+ *
+ * API: POST / with JSON body { text, voice?, length_scale? } -> WAV
+ * The WAV body is streamed, so playback can start with the first chunk.
+ */
+
+import type { ITTSProvider } from '../ITTSProvider';
+import type { SynthesizeOptions } from '../IAIProvider';
+import { createPcmResampler } from '../../../sip/AudioUtils';
+
+export class PiperTTSProvider implements ITTSProvider {
+  readonly name = 'piper';
+  readonly streamSampleRate: number;
+  readonly voiceId: string;
+  private baseUrl: string;
+  private voice?: string;
+
+  /**
+   * @param baseUrl - Piper HTTP server URL
+   * @param voice - Voice model name (omit to use the server's default voice)
+   * @param sampleRate - Output rate of the voice (22050 for "medium" voices like de_DE-thorsten-medium)
+   */
+  constructor(
+    baseUrl: string = 'http://localhost:5000',
+    voice?: string,
+    sampleRate: number = 22050
+  ) {
+    this.baseUrl = baseUrl.replace(/\/$/, '');
+    this.voice = voice;
+    this.streamSampleRate = sampleRate;
+    this.voiceId = `${this.baseUrl}|${voice ?? 'default'}|${sampleRate}`;
+  }
+
+  async synthesize(text: string, options: SynthesizeOptions): Promise<Buffer> {
+    try {
+      const response = await this.request(text, options);
+
+      // Piper returns WAV audio
+      const arrayBuffer = await response.arrayBuffer();
+      return Buffer.from(arrayBuffer);
+    } catch (error) {
+      console.error('[PiperTTSProvider] Speech synthesis failed:', error);
+      if (error instanceof Error && error.message.includes('Piper API error')) {
+        throw error;
+      }
+      throw new Error(`Piper synthesis failed: ${error instanceof Error ? error.message : 'Unknown error'}`);
+    }
+  }
+
+  async *synthesizeStream(text: string, options: SynthesizeOptions): AsyncIterable<Buffer> {
+    const response = await this.request(text, options).catch((error) => {
+      console.error('[PiperTTSProvider] Speech synthesis failed:', error);
+      throw error;
+    });
+
+    if (!response.body) {
+      throw new Error('Piper API error: empty response body');
+    }
+
+    // Skip the WAV header, then pass PCM chunks through as they arrive
+    let header: Buffer | null = Buffer.alloc(0);
+    let convert: (chunk: Buffer) => Buffer = (chunk) => chunk;
+
+    for await (const chunk of response.body as unknown as AsyncIterable<Uint8Array>) {
+      if (header === null) {
+        yield convert(Buffer.from(chunk));
+        continue;
+      }
+
+      header = Buffer.concat([header, chunk]);
+      const wav = this.parseWavHeader(header);
+      if (!wav) continue;
+
+      // Callers resample from streamSampleRate, so a voice with another rate is converted first
+      if (wav.sampleRate !== this.streamSampleRate) {
+        console.warn(
+          `[PiperTTSProvider] Voice outputs ${wav.sampleRate}Hz but ${this.streamSampleRate}Hz is configured, resampling (set TTS_PIPER_SAMPLE_RATE)`
+        );
+        convert = createPcmResampler(wav.sampleRate, this.streamSampleRate);
+      }
+
+      const pcm = convert(header.subarray(wav.dataOffset));
+      header = null;
+      if (pcm.length > 0) {
+        yield pcm;
+      }
+    }
+  }
+
+  /**
+   * Send the synthesis request
+   */
+  private async request(text: string, options: SynthesizeOptions): Promise<Response> {
+    // Strip SSML tags as Piper doesn't support them
+    const cleanText = text.replace(/<[^>]*>/g, '').trim();
+
+    // Pipeline voice names (e.g. 'nova') are OpenAI voices, so only the configured Piper voice is sent
+    const body: Record<string, unknown> = { text: cleanText };
+    if (this.voice) {
+      body.voice = this.voice;
+    }
+    if (options.speed && options.speed !== 1) {
+      body.length_scale = 1 / options.speed;
+    }
+
+    const response = await fetch(this.baseUrl, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(body)
+    });
+
+    if (!response.ok) {
+      const errorText = await response.text();
+      throw new Error(`Piper API error: ${response.status} ${response.statusText} - ${errorText}`);
+    }
+
+    return response;
+  }
+
+  /**
+   * Parse a (possibly incomplete) WAV header
+   * @returns Byte offset of the sample data and the sample rate, or null if more header bytes are needed
+   */
+  private parseWavHeader(wav: Buffer): { dataOffset: number; sampleRate: number } | null {
+    if (wav.length < 12) return null;
+    if (wav.toString('ascii', 0, 4) !== 'RIFF' || wav.toString('ascii', 8, 12) !== 'WAVE') {
+      throw new Error('Piper API error: response is not a WAV file');
+    }
+
+    let offset = 12;
+    let sampleRate = this.streamSampleRate;
+    while (offset + 8 <= wav.length) {
+      const chunkId = wav.toString('ascii', offset, offset + 4);
+      const chunkSize = wav.readUInt32LE(offset + 4);
+
+      if (chunkId === 'data') {
+        return { dataOffset: offset + 8, sampleRate };
+      }
+
+      if (chunkId === 'fmt ' && offset + 16 <= wav.length) {
+        sampleRate = wav.readUInt32LE(offset + 12);
+      }
+
+      // Chunks are padded to an even size
+      offset += 8 + chunkSize + (chunkSize % 2);
+    }
+
+    return null;
+  }
+}
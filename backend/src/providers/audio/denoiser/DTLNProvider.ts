@@ -16,6 +16,7 @@
  */
 
 import type { IDenoiserProvider, DenoiserOptions } from '../IDenoiserProvider';
+import { pcmSamples, samplesToPcm } from '../../../sip/AudioUtils';
 
 // Type for libsamplerate-js
 interface SRC {
@@ -247,11 +248,12 @@ export class DTLNProvider implements IDenoiserProvider {
    * Convert Int16 PCM buffer to Float32 array
    */
   private int16ToFloat32(pcmData: Buffer): Float32Array {
-    const numSamples = pcmData.length / 2;
+    const pcm = pcmSamples(pcmData);
+    const numSamples = pcm.length;
     const floatData = new Float32Array(numSamples);
 
     for (let i = 0; i < numSamples; i++) {
-      floatData[i] = pcmData.readInt16LE(i * 2) / 32768;
+      floatData[i] = pcm[i] / 32768;
     }
 
     return floatData;
@@ -261,15 +263,15 @@ export class DTLNProvider implements IDenoiserProvider {
    * Convert Float32 array to Int16 PCM buffer
    */
   private float32ToInt16(input: Float32Array): Buffer {
-    const output = Buffer.alloc(input.length * 2);
+    const output = new Int16Array(input.length);
 
     for (let i = 0; i < input.length; i++) {
       // Clamp to [-1, 1] to prevent overflow
       const sample = Math.max(-1, Math.min(1, input[i]));
-      output.writeInt16LE(Math.round(sample * 32767), i * 2);
+      output[i] = Math.round(sample * 32767);
     }
 
-    return output;
+    return samplesToPcm(output);
   }
 
   async destroy(): Promise<void> {
@@ -0,0 +1,332 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import OpenAI from 'openai';
+import { env } from '../config/env';
+import { getOpenAIClient, SDK_RETRY_OPTIONS } from '../providers/ai/openaiClient';
+
+export interface CallSummary {
+  callId: string;
+  summary: string;
+  source: string; // 'voicebot' | 'monitor'
+  createdAt: string;
+}
+
+interface BatchRequestLine {
+  custom_id: string;
+  method: 'POST';
+  url: '/v1/chat/completions';
+  body: {
+    model: string;
+    messages: { role: 'system' | 'user'; content: string }[];
+    max_tokens: number;
+  };
+}
+
+const SUMMARY_PROMPT = `Du analysierst Transkripte von Kundengesprächen eines Stadtwerks.
+Fasse das Gespräch in 2-3 Sätzen zusammen: Anliegen des Kunden, genannte Daten (z.B. Zählerstand, Zählernummer) und ob das Anliegen erledigt wurde.`;
+
+/**
+ * Call Analytics Service
+ *
+ * Post-call summaries via the OpenAI Batch API. Summaries are not latency
+ * critical, so instead of a chat request per call they are collected and
+ * submitted as a batch: half the price, and a separate rate limit pool that
+ * does not compete with live calls.
+ *
+ * Flow:
+ * 1. Call ends → request line appended to pending_batch.jsonl
+ * 2. Every CALL_ANALYTICS_FLUSH_MINUTES the pending file is uploaded and submitted
+ * 3. Submitted batches are polled; results are stored as summaries/<source>/<callId>.json
+ *
+ * Submitted batch IDs are persisted, so polling resumes after a restart
+ * (pending calls and batches are picked up right at start).
+ */
+export class CallAnalyticsService {
+  private readonly dataDir: string;
+  private readonly pendingFile: string;
+  private readonly stateFile: string;
+  private readonly summaryDir: string;
+  private client: OpenAI | null = null;
+  private timer: NodeJS.Timeout | null = null;
+  private writeQueue: Promise<void> = Promise.resolve();
+  private flushing: Promise<void> | null = null;
+
+  constructor(dataDir: string) {
+    this.dataDir = dataDir;
+    this.pendingFile = path.join(dataDir, 'pending_batch.jsonl');
+    this.stateFile = path.join(dataDir, 'batches.json');
+    this.summaryDir = path.join(dataDir, 'summaries');
+  }
+
+  /**
+   * Start periodic batch submission and polling
+   */
+  async start(): Promise<void> {
+    if (!env.OPENAI_API_KEY) {
+      console.warn('[CallAnalytics] OPENAI_API_KEY not set, call analytics disabled');
+      return;
+    }
+
+    this.client = getOpenAIClient(env.OPENAI_API_KEY);
+    await fs.promises.mkdir(this.summaryDir, { recursive: true });
+
+    const flush = () => {
+      this.flush().catch((error) => {
+        console.error('[CallAnalytics] Flush failed:', error);
+      });
+    };
+
+    const intervalMs = env.CALL_ANALYTICS_FLUSH_MINUTES * 60 * 1000;
+    this.timer = setInterval(flush, intervalMs);
+
+    // Submit and collect what was left over from before a restart
+    flush();
+
+    console.log(
+      `[CallAnalytics] Started (flush every ${env.CALL_ANALYTICS_FLUSH_MINUTES}min, data: ${this.dataDir})`
+    );
+  }
+
+  /**
+   * Queue a finished call for summarization
+   * @param callId - Call identifier (batch custom_id is "<source>:<callId>")
+   * @param transcript - Conversation transcript, one turn per line
+   * @param source - Service the call came from ('voicebot' | 'monitor')
+   */
+  enqueueCall(callId: string, transcript: string, source: string): void {
+    if (!this.isRunning() || !transcript.trim()) {
+      return;
+    }
+
+    const line: BatchRequestLine = {
+      custom_id: `${source}:${callId}`,
+      method: 'POST',
+      url: '/v1/chat/completions',
+      body: {
+        model: env.CALL_ANALYTICS_MODEL,
+        messages: [
+          { role: 'system', content: SUMMARY_PROMPT },
+          { role: 'user', content: transcript }
+        ],
+        max_tokens: 300
+      }
+    };
+
+    // Failures are logged by appendPending()
+    this.appendPending(JSON.stringify(line) + '\n');
+  }
+
+  /**
+   * Submit pending calls as a new batch and collect finished batches
+   * (joins the flush already in progress, if any)
+   */
+  async flush(): Promise<void> {
+    if (!this.client) {
+      return;
+    }
+
+    this.flushing ??= (async () => {
+      try {
+        await this.submitPending();
+        await this.pollBatches();
+      } finally {
+        this.flushing = null;
+      }
+    })();
+    return this.flushing;
+  }
+
+  /**
+   * Get the stored summary for a call (null if not available yet)
+   * @param source - Service the call came from ('voicebot' | 'monitor')
+   */
+  async getCallSummary(callId: string, source: string): Promise<CallSummary | null> {
+    try {
+      const content = await fs.promises.readFile(this.summaryPath(source, callId), 'utf8');
+      return JSON.parse(content) as CallSummary;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Stop periodic processing (pending calls stay on disk for the next start)
+   * Waits for queued writes and a flush in progress, which still needs the client
+   */
+  async stop(): Promise<void> {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+    await this.writeQueue;
+    await this.flushing?.catch(() => {
+      // Already logged by the flush caller, the requests stay on disk
+    });
+    this.client = null;
+  }
+
+  /**
+   * Check if service is running
+   */
+  isRunning(): boolean {
+    return this.client !== null;
+  }
+
+  private async submitPending(): Promise<void> {
+    // Move the pending file aside first, so calls ending during the upload go into a new file
+    await this.writeQueue;
+    const submitFile = path.join(this.dataDir, `batch-${Date.now()}.jsonl`);
+    try {
+      await fs.promises.rename(this.pendingFile, submitFile);
+    } catch {
+      return; // Nothing pending
+    }
+
+    let batch: OpenAI.Batch;
+    try {
+      // Not latency critical and outside the RequestScheduler, so the SDK retries on its own
+      const file = await this.client!.files.create(
+        { file: fs.createReadStream(submitFile), purpose: 'batch' },
+        SDK_RETRY_OPTIONS
+      );
+
+      batch = await this.client!.batches.create(
+        { input_file_id: file.id, endpoint: '/v1/chat/completions', completion_window: '24h' },
+        SDK_RETRY_OPTIONS
+      );
+    } catch (error) {
+      // Not submitted: put the requests back for the next flush
+      const content = await fs.promises.readFile(submitFile, 'utf8');
+      await this.appendPending(content);
+      await fs.promises.unlink(submitFile);
+      throw error;
+    }
+
+    // The batch exists now, so the requests must not be submitted again
+    await fs.promises.unlink(submitFile);
+    try {
+      const state = await this.readState();
+      state.push(batch.id);
+      await this.writeState(state);
+    } catch (error) {
+      throw new Error(
+        `Batch ${batch.id} submitted but not recorded, results will not be collected: ${error}`
+      );
+    }
+
+    console.log(`[CallAnalytics] Submitted batch ${batch.id}`);
+  }
+
+  /**
+   * Append request lines to the pending file
+   * Appends are serialized through writeQueue so lines never interleave
+   */
+  private appendPending(content: string): Promise<void> {
+    const write = this.writeQueue.then(() => fs.promises.appendFile(this.pendingFile, content));
+    this.writeQueue = write.catch((error) => {
+      console.error('[CallAnalytics] Failed to write pending requests:', error);
+    });
+    return write;
+  }
+
+  private async pollBatches(): Promise<void> {
+    const state = await this.readState();
+    const remaining: string[] = [];
+
+    // One failing batch must not block the others, it is retried on the next flush
+    for (const batchId of state) {
+      try {
+        const batch = await this.client!.batches.retrieve(batchId, SDK_RETRY_OPTIONS);
+
+        if (batch.status === 'completed') {
+          if (batch.output_file_id) {
+            await this.storeResults(batch.output_file_id);
+          }
+          console.log(
+            `[CallAnalytics] Batch ${batchId} completed (${batch.request_counts?.completed ?? 0} summaries)`
+          );
+        } else if (['failed', 'expired', 'cancelled'].includes(batch.status)) {
+          console.error(`[CallAnalytics] Batch ${batchId} ${batch.status}`);
+        } else {
+          remaining.push(batchId);
+        }
+      } catch (error) {
+        if (error instanceof OpenAI.NotFoundError) {
+          console.error(`[CallAnalytics] Batch ${batchId} not found, dropping it`);
+        } else {
+          console.error(`[CallAnalytics] Failed to poll batch ${batchId}:`, error);
+          remaining.push(batchId);
+        }
+      }
+    }
+
+    if (remaining.length !== state.length) {
+      await this.writeState(remaining);
+    }
+  }
+
+  private async storeResults(outputFileId: string): Promise<void> {
+    const response = await this.client!.files.content(outputFileId, SDK_RETRY_OPTIONS);
+    const lines = (await response.text()).split('\n').filter((line) => line.trim());
+
+    for (const line of lines) {
+      try {
+        const result = JSON.parse(line);
+        const summary: string | undefined = result.response?.body?.choices?.[0]?.message?.content;
+
+        if (!summary) {
+          console.warn(`[CallAnalytics] No summary for call ${result.custom_id}:`, result.error);
+          continue;
+        }
+
+        const customId: string = result.custom_id;
+        const separator = customId.indexOf(':');
+        const entry: CallSummary = {
+          callId: customId.slice(separator + 1),
+          summary: summary.trim(),
+          source: customId.slice(0, separator),
+          createdAt: new Date().toISOString()
+        };
+
+        const file = this.summaryPath(entry.source, entry.callId);
+        await fs.promises.mkdir(path.dirname(file), { recursive: true });
+        await fs.promises.writeFile(file, JSON.stringify(entry, null, 2));
+      } catch (error) {
+        console.error('[CallAnalytics] Failed to store batch result line:', error);
+      }
+    }
+  }
+
+  private async readState(): Promise<string[]> {
+    try {
+      return JSON.parse(await fs.promises.readFile(this.stateFile, 'utf8')) as string[];
+    } catch {
+      return [];
+    }
+  }
+
+  private async writeState(batchIds: string[]): Promise<void> {
+    await fs.promises.writeFile(this.stateFile, JSON.stringify(batchIds, null, 2));
+  }
+
+  private summaryPath(source: string, callId: string): string {
+    // SIP Call-IDs may contain characters that are not valid in file names
+    const safe = (name: string) => name.replace(/[^A-Za-z0-9._@-]/g, '_');
+    return path.join(this.summaryDir, safe(source), `${safe(callId)}.json`);
+  }
+}
+
+// Singleton instance
+let callAnalyticsService: CallAnalyticsService | null = null;
+
+/**
+ * Get the singleton call analytics service instance
+ */
+export function getCallAnalyticsService(): CallAnalyticsService {
+  if (!callAnalyticsService) {
+    callAnalyticsService = new CallAnalyticsService(
+      env.CALL_ANALYTICS_DIR || path.join(env.WORKSHOP_DATA_DIR, 'call-analytics')
+    );
+  }
+  return callAnalyticsService;
+}
@@ -3,6 +3,7 @@ import { env } from '../config/env';
 import { SIPServerService, RTPAudioHandler, PassiveListenerPipeline } from '../sip';
 import { ProviderRegistry } from '../providers/ProviderRegistry';
 import { createProviderRegistry, initializeAsyncProviders } from '../providers/ProviderFactory';
+import { getCallAnalyticsService } from './CallAnalyticsService';
 
 export interface MonitorSessionOptions {
   sttProvider?: string;
@@ -81,9 +82,12 @@ export class MonitorService extends EventEmitter {
     );
 
     // Handle incoming calls - these are monitoring requests
-    this.sipServer.on('callStarted', async ({ callId, rtpHandler }) => {
+    this.sipServer.on('callStarted', ({ callId, rtpHandler }) => {
       console.log(`[MonitorService] Incoming monitor request: ${callId}`);
-      await this.handleIncomingCall(callId, rtpHandler);
+      // Not awaited by the emitter: handle failures here instead of as unhandled rejections
+      this.handleIncomingCall(callId, rtpHandler).catch((error) => {
+        console.error(`[MonitorService] Failed to handle call ${callId}:`, error);
+      });
     });
 
     // Handle call endings
@@ -112,7 +116,10 @@ export class MonitorService extends EventEmitter {
       sttProvider: sessionOptions.sttProvider,
       language: sessionOptions.language,
       sendComfortNoise: true,
-      denoiserProvider: sessionOptions.denoiserProvider
+      denoiserProvider: sessionOptions.denoiserProvider,
+      streamingTranscription: env.MONITOR_STREAMING_TRANSCRIPTION,
+      streamingStepMs: env.MONITOR_STREAMING_STEP_MS,
+      streamingBufferMs: env.MONITOR_STREAMING_BUFFER_MS
     });
 
     // Store session with transcript history
@@ -128,12 +135,14 @@ export class MonitorService extends EventEmitter {
 
     // Forward pipeline events
     pipeline.on('transcription', (data) => {
-      // Store transcript
-      session.transcripts.push({
-        text: data.text,
-        timestamp: data.timestamp,
-        durationMs: data.durationMs
-      });
+      // Store transcript (partial streaming hypotheses are only broadcast)
+      if (data.isFinal) {
+        session.transcripts.push({
+          text: data.text,
+          timestamp: data.timestamp,
+          durationMs: data.durationMs
+        });
+      }
 
       // Emit for WebSocket broadcast
       this.emit('transcription', {
@@ -183,11 +192,23 @@ export class MonitorService extends EventEmitter {
   private handleCallEnded(callId: string): void {
     const session = this.activeSessions.get(callId);
     if (session) {
-      session.pipeline.stop();
       this.activeSessions.delete(callId);
+      this.finishSession(session).catch((error) => {
+        console.error(`[MonitorService] Failed to finish session ${callId}:`, error);
+      });
     }
   }
 
+  /**
+   * Stop the pipeline and queue the transcript for analytics
+   * (the last utterance is still being transcribed after stop())
+   */
+  private async finishSession(session: MonitorSession): Promise<void> {
+    await session.pipeline.stop();
+    await session.pipeline.whenIdle();
+    this.queueAnalytics(session);
+  }
+
   /**
    * Get active monitoring sessions
    */
@@ -242,10 +263,21 @@ export class MonitorService extends EventEmitter {
       await this.sipServer.terminateCall(callId);
     }
 
-    this.activeSessions.delete(callId);
+    // terminateCall() emits callEnded, which may already have cleaned up the session
+    if (this.activeSessions.delete(callId)) {
+      await this.finishSession(session);
+    }
     return true;
   }
 
+  /**
+   * Queue the finished session's transcript for a post-call summary
+   */
+  private queueAnalytics(session: MonitorSession): void {
+    const transcript = session.transcripts.map((t) => t.text).join('\n');
+    getCallAnalyticsService().enqueueCall(session.callId, transcript, 'monitor');
+  }
+
   /**
    * Update default options
    */
@@ -274,11 +306,16 @@ export class MonitorService extends EventEmitter {
   async stop(): Promise<void> {
     console.log('[MonitorService] Stopping...');
 
-    // Stop all active sessions
-    for (const session of this.activeSessions.values()) {
-      await session.pipeline.stop();
-    }
+    // Stop all active sessions (their transcripts are queued for analytics)
+    const sessions = Array.from(this.activeSessions.values());
     this.activeSessions.clear();
+    await Promise.all(
+      sessions.map((session) =>
+        this.finishSession(session).catch((error) => {
+          console.error(`[MonitorService] Failed to finish session ${session.callId}:`, error);
+        })
+      )
+    );
 
     // Stop SIP server
     if (this.sipServer) {
@@ -3,6 +3,7 @@ import { env } from '../config/env';
 import { SIPServerService, VoiceAgentPipeline, RTPAudioHandler } from '../sip';
 import { ProviderRegistry } from '../providers/ProviderRegistry';
 import { createProviderRegistry } from '../providers/ProviderFactory';
+import { getCallAnalyticsService } from './CallAnalyticsService';
 
 export interface SIPCallOptions {
   systemPrompt?: string;
@@ -17,6 +18,7 @@ interface ActiveCall {
   rtpHandler: RTPAudioHandler;
   startedAt: Date;
   options: SIPCallOptions;
+  transcript: string[]; // "Kunde: ..." / "Agent: ..." lines for post-call analytics
 }
 
 /**
@@ -63,9 +65,12 @@ export class SIPVoiceService extends EventEmitter {
     );
 
     // Handle incoming calls
-    this.sipServer.on('callStarted', async ({ callId, rtpHandler }) => {
+    this.sipServer.on('callStarted', ({ callId, rtpHandler }) => {
       console.log(`[SIPVoiceService] Incoming call: ${callId}`);
-      await this.handleIncomingCall(callId, rtpHandler);
+      // Not awaited by the emitter: handle failures here instead of as unhandled rejections
+      this.handleIncomingCall(callId, rtpHandler).catch((error) => {
+        console.error(`[SIPVoiceService] Failed to handle call ${callId}:`, error);
+      });
     });
 
     // Handle call endings
@@ -83,6 +88,12 @@ export class SIPVoiceService extends EventEmitter {
     // Start listening
     await this.sipServer.start();
     console.log('[SIPVoiceService] SIP voice service started');
+
+    // Pre-synthesize the greeting so the first call does not wait for TTS
+    const ttsName = this.defaultOptions.ttsProvider || 'openai';
+    VoiceAgentPipeline.warmUpSpeech(this.registry, ttsName).catch((error) => {
+      console.warn('[SIPVoiceService] TTS warm-up failed:', error);
+    });
   }
 
   /**
@@ -103,24 +114,28 @@ export class SIPVoiceService extends EventEmitter {
       ttsProvider: callOptions.ttsProvider
     });
 
+    // Store active call
+    const call: ActiveCall = {
+      callId,
+      pipeline,
+      rtpHandler,
+      startedAt: new Date(),
+      options: callOptions,
+      transcript: []
+    };
+    this.activeCalls.set(callId, call);
+
     // Forward pipeline events
     pipeline.on('transcription', (data) => {
+      call.transcript.push(`Kunde: ${data.text}`);
       this.emit('transcription', data);
     });
 
     pipeline.on('agentResponse', (data) => {
+      call.transcript.push(`Agent: ${data.text}`);
       this.emit('agentResponse', data);
     });
 
-    // Store active call
-    this.activeCalls.set(callId, {
-      callId,
-      pipeline,
-      rtpHandler,
-      startedAt: new Date(),
-      options: callOptions
-    });
-
     // Start the pipeline
     try {
       await pipeline.start();
@@ -137,12 +152,24 @@ export class SIPVoiceService extends EventEmitter {
   private handleCallEnded(callId: string): void {
     const call = this.activeCalls.get(callId);
     if (call) {
-      call.pipeline.stop();
       this.activeCalls.delete(callId);
       this.emit('callEnded', { callId, duration: Date.now() - call.startedAt.getTime() });
+      this.finishCall(call).catch((error) => {
+        console.error(`[SIPVoiceService] Failed to finish call ${callId}:`, error);
+      });
     }
   }
 
+  /**
+   * Stop the pipeline and queue the transcript for analytics
+   * once the turn in flight has added its text
+   */
+  private async finishCall(call: ActiveCall): Promise<void> {
+    await call.pipeline.stop();
+    await call.pipeline.whenIdle();
+    getCallAnalyticsService().enqueueCall(call.callId, call.transcript.join('\n'), 'voicebot');
+  }
+
   /**
    * Configure options for new calls
    */
@@ -179,8 +206,11 @@ export class SIPVoiceService extends EventEmitter {
       await this.sipServer.terminateCall(callId);
     }
 
-    this.activeCalls.delete(callId);
-    this.emit('callEnded', { callId, duration: Date.now() - call.startedAt.getTime() });
+    // terminateCall() emits callEnded, which may already have cleaned up the call
+    if (this.activeCalls.delete(callId)) {
+      await this.finishCall(call);
+      this.emit('callEnded', { callId, duration: Date.now() - call.startedAt.getTime() });
+    }
     return true;
   }
 
@@ -197,11 +227,16 @@ export class SIPVoiceService extends EventEmitter {
   async stop(): Promise<void> {
     console.log('[SIPVoiceService] Stopping...');
 
-    // Stop all active calls
-    for (const call of this.activeCalls.values()) {
-      await call.pipeline.stop();
-    }
+    // Stop all active calls (their transcripts are queued for analytics)
+    const calls = Array.from(this.activeCalls.values());
     this.activeCalls.clear();
+    await Promise.all(
+      calls.map((call) =>
+        this.finishCall(call).catch((error) => {
+          console.error(`[SIPVoiceService] Failed to finish call ${call.callId}:`, error);
+        })
+      )
+    );
 
     // Stop SIP server
     if (this.sipServer) {
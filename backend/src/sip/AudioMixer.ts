@@ -1,5 +1,6 @@
 import { EventEmitter } from 'events';
 import { RTPAudioHandler } from './RTPAudioHandler';
+import { pcmSamples, samplesToPcm } from './AudioUtils';
 
 /**
  * Audio Mixer for B2BUA
@@ -154,20 +155,19 @@ export class AudioMixer extends EventEmitter {
 
     // Find the maximum length
     const maxLength = Math.max(...buffers.map((b) => b.length));
-    const output = Buffer.alloc(maxLength);
+    const sources = buffers.map(pcmSamples);
 
     // Mix samples
-    const numSamples = maxLength / this.BYTES_PER_SAMPLE;
+    const numSamples = Math.floor(maxLength / this.BYTES_PER_SAMPLE);
+    const output = new Int16Array(numSamples);
 
     for (let i = 0; i < numSamples; i++) {
-      const offset = i * this.BYTES_PER_SAMPLE;
       let sum = 0;
 
       // Sum all sources
-      for (const buffer of buffers) {
-        if (offset + this.BYTES_PER_SAMPLE <= buffer.length) {
-          const sample = buffer.readInt16LE(offset);
-          sum += sample;
+      for (const source of sources) {
+        if (i < source.length) {
+          sum += source[i];
         }
       }
 
@@ -175,12 +175,10 @@ export class AudioMixer extends EventEmitter {
       const mixed = Math.round(sum * this.GAIN_REDUCTION_FACTOR);
 
       // Clamp to 16-bit range
-      const clamped = Math.max(-32768, Math.min(32767, mixed));
-
-      output.writeInt16LE(clamped, offset);
+      output[i] = Math.max(-32768, Math.min(32767, mixed));
     }
 
-    return output;
+    return samplesToPcm(output);
   }
 
   /**
@@ -6,8 +6,90 @@ import { spawn } from 'child_process';
  * Handles conversion between different audio formats:
  * - PCM 8kHz (telephony) ↔ WAV (for STT providers)
  * - MP3/WAV (from TTS providers) → PCM 8kHz (for RTP)
+ * - Streamed PCM (from TTS providers) → PCM 8kHz (for RTP)
  */
 
+/**
+ * View 16-bit PCM as samples without copying
+ * Typed array access is much faster than per-sample readInt16LE() calls.
+ * Buffers at an odd byte offset (e.g. slices of a packet) are copied once.
+ * A trailing odd byte is ignored, so take sample counts from the result's
+ * length rather than from pcmData.length / 2.
+ * Assumes a little-endian host like x86 and ARM.
+ *
+ * @param pcmData - Raw PCM 16-bit buffer
+ * @returns Int16Array over the same memory (or an aligned copy)
+ */
+export function pcmSamples(pcmData: Buffer): Int16Array {
+  const length = pcmData.length >> 1;
+
+  if (pcmData.byteOffset % 2 === 0) {
+    return new Int16Array(pcmData.buffer, pcmData.byteOffset, length);
+  }
+
+  const aligned = new Int16Array(length);
+  new Uint8Array(aligned.buffer).set(pcmData.subarray(0, length * 2));
+  return aligned;
+}
+
+/**
+ * Wrap samples as a PCM Buffer without copying
+ *
+ * @param samples - 16-bit samples
+ * @returns Buffer over the same memory
+ */
+export function samplesToPcm(samples: Int16Array): Buffer {
+  return Buffer.from(samples.buffer, samples.byteOffset, samples.byteLength);
+}
+
+// WAV header templates per sample rate (only the size fields differ per file)
+const wavHeaderTemplates = new Map<number, Buffer>();
+
+/**
+ * Create a 44-byte WAV header for 16-bit mono PCM
+ * The header is built once per sample rate; only the size fields are patched
+ *
+ * @param dataLength - Length of the PCM data in bytes
+ * @param sampleRate - Sample rate in Hz (typically 8000 for telephony)
+ * @returns WAV header buffer
+ */
+export function createWavHeader(dataLength: number, sampleRate: number = 8000): Buffer {
+  let template = wavHeaderTemplates.get(sampleRate);
+
+  if (!template) {
+    const numChannels = 1; // Mono
+    const bitsPerSample = 16;
+    const byteRate = (sampleRate * numChannels * bitsPerSample) / 8;
+    const blockAlign = (numChannels * bitsPerSample) / 8;
+
+    template = Buffer.alloc(44);
+
+    // RIFF header
+    template.write('RIFF', 0);
+    template.write('WAVE', 8);
+
+    // fmt subchunk
+    template.write('fmt ', 12);
+    template.writeUInt32LE(16, 16); // Subchunk1Size (16 for PCM)
+    template.writeUInt16LE(1, 20); // AudioFormat (1 = PCM)
+    template.writeUInt16LE(numChannels, 22); // NumChannels
+    template.writeUInt32LE(sampleRate, 24); // SampleRate
+    template.writeUInt32LE(byteRate, 28); // ByteRate
+    template.writeUInt16LE(blockAlign, 32); // BlockAlign
+    template.writeUInt16LE(bitsPerSample, 34); // BitsPerSample
+
+    // data subchunk
+    template.write('data', 36);
+
+    wavHeaderTemplates.set(sampleRate, template);
+  }
+
+  const header = Buffer.from(template);
+  header.writeUInt32LE(36 + dataLength, 4); // File size - 8
+  header.writeUInt32LE(dataLength, 40); // Subchunk2Size
+  return header;
+}
+
 /**
  * Convert raw PCM to WAV format
  * Required for STT providers that expect WAV input
@@ -17,38 +99,22 @@ import { spawn } from 'child_process';
  * @returns WAV buffer with proper headers
  */
 export function pcmToWav(pcmData: Buffer, sampleRate: number = 8000): Buffer {
-  const numChannels = 1; // Mono
-  const bitsPerSample = 16;
-  const byteRate = (sampleRate * numChannels * bitsPerSample) / 8;
-  const blockAlign = (numChannels * bitsPerSample) / 8;
-
-  // WAV header is 44 bytes
-  const headerSize = 44;
-  const wavBuffer = Buffer.alloc(headerSize + pcmData.length);
-
-  // RIFF header
-  wavBuffer.write('RIFF', 0);
-  wavBuffer.writeUInt32LE(36 + pcmData.length, 4); // File size - 8
-  wavBuffer.write('WAVE', 8);
-
-  // fmt subchunk
-  wavBuffer.write('fmt ', 12);
-  wavBuffer.writeUInt32LE(16, 16); // Subchunk1Size (16 for PCM)
-  wavBuffer.writeUInt16LE(1, 20); // AudioFormat (1 = PCM)
-  wavBuffer.writeUInt16LE(numChannels, 22); // NumChannels
-  wavBuffer.writeUInt32LE(sampleRate, 24); // SampleRate
-  wavBuffer.writeUInt32LE(byteRate, 28); // ByteRate
-  wavBuffer.writeUInt16LE(blockAlign, 32); // BlockAlign
-  wavBuffer.writeUInt16LE(bitsPerSample, 34); // BitsPerSample
-
-  // data subchunk
-  wavBuffer.write('data', 36);
-  wavBuffer.writeUInt32LE(pcmData.length, 40); // Subchunk2Size
-
-  // Copy PCM data
-  pcmData.copy(wavBuffer, headerSize);
+  return Buffer.concat([createWavHeader(pcmData.length, sampleRate), pcmData]);
+}
 
-  return wavBuffer;
+/**
+ * Get WAV file parts for an STT upload without building a WAV buffer
+ * Blob/File copy their parts once, so header + PCM avoids an extra full copy
+ *
+ * @param audio - WAV file, or raw 16-bit mono PCM if pcmSampleRate is given
+ * @param pcmSampleRate - Sample rate of raw PCM input (omit for WAV input)
+ * @returns Parts to pass to the Blob/File constructor
+ */
+export function wavParts(audio: Buffer, pcmSampleRate?: number): Buffer[] {
+  if (pcmSampleRate === undefined) {
+    return [audio];
+  }
+  return [createWavHeader(audio.length, pcmSampleRate), audio];
 }
 
 /**
@@ -211,6 +277,65 @@ export async function resamplePcm(
   });
 }
 
+/**
+ * Create a streaming PCM resampler
+ * Keeps leftover samples between calls so chunks of any size can be fed in,
+ * e.g. straight from a TTS response stream
+ *
+ * @param fromRate - Source sample rate
+ * @param toRate - Target sample rate
+ * @returns Function converting each 16-bit mono PCM chunk to the target rate
+ */
+export function createPcmResampler(fromRate: number, toRate: number): (chunk: Buffer) => Buffer {
+  if (fromRate === toRate) {
+    return (chunk) => chunk;
+  }
+
+  const step = fromRate / toRate;
+  let carry: Buffer = Buffer.alloc(0);
+  let position = 0; // Fractional read position into carry + chunk (in samples)
+
+  return (chunk: Buffer): Buffer => {
+    const data = carry.length > 0 ? Buffer.concat([carry, chunk]) : chunk;
+    const input = pcmSamples(data);
+    const totalSamples = input.length;
+
+    if (Number.isInteger(step)) {
+      // Integer decimation (e.g. 24kHz -> 8kHz): average each group as a cheap low-pass
+      const outSamples = Math.floor(totalSamples / step);
+      const output = new Int16Array(outSamples);
+      for (let o = 0, i = 0; o < outSamples; o++) {
+        let sum = 0;
+        for (let k = 0; k < step; k++, i++) {
+          sum += input[i];
+        }
+        output[o] = Math.round(sum / step);
+      }
+      carry = Buffer.from(data.subarray(outSamples * step * 2));
+      return samplesToPcm(output);
+    }
+
+    // Arbitrary ratio: linear interpolation between neighbouring samples
+    const maxOutput = Math.max(0, Math.ceil((totalSamples - 1 - position) / step));
+    const output = new Int16Array(maxOutput);
+    let written = 0;
+    while (position + 1 < totalSamples) {
+      const index = Math.floor(position);
+      const frac = position - index;
+      const a = input[index];
+      const b = input[index + 1];
+      output[written++] = Math.round(a + (b - a) * frac);
+      position += step;
+    }
+
+    const consumed = Math.min(Math.floor(position), totalSamples);
+    position -= consumed;
+    carry = Buffer.from(data.subarray(consumed * 2));
+
+    return samplesToPcm(output.subarray(0, written));
+  };
+}
+
 /**
  * Calculate audio duration in milliseconds
  *
@@ -231,15 +356,14 @@ export function getAudioDurationMs(pcmData: Buffer, sampleRate: number = 8000):
  * @returns RMS value normalized to 0-1 range
  */
 export function calculateRms(pcmData: Buffer): number {
+  const samples = pcmSamples(pcmData);
   let sumSquares = 0;
-  const numSamples = pcmData.length / 2;
 
-  for (let i = 0; i < pcmData.length; i += 2) {
-    const sample = pcmData.readInt16LE(i);
-    sumSquares += sample * sample;
+  for (let i = 0; i < samples.length; i++) {
+    sumSquares += samples[i] * samples[i];
   }
 
-  const rms = Math.sqrt(sumSquares / numSamples);
+  const rms = Math.sqrt(sumSquares / samples.length);
   return rms / 32768; // Normalize to 0-1
 }
 
@@ -253,3 +377,77 @@ export function rmsToDb(rms: number): number {
   if (rms <= 0) return -100;
   return 20 * Math.log10(rms);
 }
+
+/**
+ * Energy and zero-crossing count of a block of samples
+ * Single pass over the samples, used by the pre-STT speech gate
+ *
+ * @param samples - 16-bit samples (e.g. one 20ms frame)
+ * @returns Mean square energy and number of sign changes
+ */
+export function energyZcr(samples: Int16Array): { meanSquare: number; zeroCrossings: number } {
+  if (samples.length === 0) {
+    return { meanSquare: 0, zeroCrossings: 0 };
+  }
+
+  let sumSquares = samples[0] * samples[0];
+  let zeroCrossings = 0;
+  let prev = samples[0];
+
+  for (let i = 1; i < samples.length; i++) {
+    const x = samples[i];
+    sumSquares += x * x;
+    if ((x ^ prev) < 0) zeroCrossings++; // Sign bit differs
+    prev = x;
+  }
+
+  return { meanSquare: sumSquares / samples.length, zeroCrossings };
+}
+
+export interface SpeechGateOptions {
+  sampleRate?: number; // default: 8000
+  frameMs?: number; // default: 20
+  minRmsDb?: number; // Voiced speech level, pass the VAD's silenceThresholdDb (default: -40 dBFS like VADBuffer)
+  minZcrRate?: number; // Crossings per sample for unvoiced sounds like "s", "f" (default: 0.3)
+  minActiveFrames?: number; // Frames needed to count as speech (default: 5 = 100ms)
+}
+
+/**
+ * Check if audio contains enough speech to be worth sending to STT
+ *
+ * A 20ms frame counts as active if it is loud enough for voiced speech, or if
+ * it has a high zero-crossing rate (fricatives) at a lower level. Utterances
+ * with fewer active frames than required (clicks, breathing, line noise) are
+ * skipped instead of costing an STT request - and Whisper tends to hallucinate
+ * text for them anyway.
+ *
+ * @param pcmData - Raw PCM 16-bit buffer
+ * @param options - Gate thresholds
+ * @returns true if the audio likely contains speech
+ */
+export function containsSpeech(pcmData: Buffer, options: SpeechGateOptions = {}): boolean {
+  const sampleRate = options.sampleRate ?? 8000;
+  const frameSamples = Math.round((sampleRate * (options.frameMs ?? 20)) / 1000);
+  const minRms = 32768 * Math.pow(10, (options.minRmsDb ?? -40) / 20);
+  const minMeanSquare = minRms * minRms;
+  const minZcr = (options.minZcrRate ?? 0.3) * frameSamples;
+  const minActiveFrames = options.minActiveFrames ?? 5;
+
+  const samples = pcmSamples(pcmData);
+  let activeFrames = 0;
+
+  for (let start = 0; start + frameSamples <= samples.length; start += frameSamples) {
+    const { meanSquare, zeroCrossings } = energyZcr(samples.subarray(start, start + frameSamples));
+
+    // Unvoiced sounds are quieter: accept them 12 dB below the voiced threshold
+    const isActive =
+      meanSquare >= minMeanSquare ||
+      (zeroCrossings >= minZcr && meanSquare >= minMeanSquare / 16);
+
+    if (isActive && ++activeFrames >= minActiveFrames) {
+      return true;
+    }
+  }
+
+  return false;
+}
@@ -7,6 +7,8 @@
  * Memory usage: ~10KB per instance (constant, regardless of call duration)
  */
 
+import { pcmSamples, samplesToPcm } from './AudioUtils';
+
 export interface BufferPoolConfig {
   /**
    * Input sample rate (default: 8000 Hz - telephony standard)
@@ -92,9 +94,10 @@ export class BufferPool {
    * Uses pre-allocated inputFloat32 buffer
    */
   int16ToFloat32(input: Buffer): Float32Array {
-    const samples = Math.min(input.length / 2, this.inputFloat32.length);
+    const pcm = pcmSamples(input);
+    const samples = Math.min(pcm.length, this.inputFloat32.length);
     for (let i = 0; i < samples; i++) {
-      this.inputFloat32[i] = input.readInt16LE(i * 2) / 32768;
+      this.inputFloat32[i] = pcm[i] / 32768;
     }
     return this.inputFloat32;
   }
@@ -106,15 +109,15 @@ export class BufferPool {
    */
   float32ToInt16Buffer(input: Float32Array): Buffer {
     const samples = Math.min(input.length, this.outputInt16.length);
-    const output = Buffer.alloc(samples * 2);
+    const output = new Int16Array(samples);
 
     for (let i = 0; i < samples; i++) {
       // Clamp to [-1, 1] to prevent overflow
       const sample = Math.max(-1, Math.min(1, input[i]));
-      output.writeInt16LE(Math.round(sample * 32767), i * 2);
+      output[i] = Math.round(sample * 32767);
     }
 
-    return output;
+    return samplesToPcm(output);
   }
 
   /**
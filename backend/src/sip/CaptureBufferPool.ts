@@ -0,0 +1,46 @@
+/**
+ * Capture Buffer Pool
+ *
+ * Recycles fixed-size buffers for captured utterance audio.
+ * Instead of collecting 20ms packets and concatenating them into a fresh
+ * buffer for every utterance, audio is copied into a pooled buffer that is
+ * handed back once the utterance has been transcribed.
+ *
+ * Buffers are allocated on first use, so calls that never speak cost nothing.
+ * Buffers that are never released are simply garbage collected; the pool
+ * then allocates a new one on the next acquire().
+ */
+export class CaptureBufferPool {
+  private free: Buffer[] = [];
+  private readonly bufferBytes: number;
+  private readonly maxPooled: number;
+
+  constructor(bufferBytes: number, maxPooled: number = 4) {
+    this.bufferBytes = bufferBytes;
+    this.maxPooled = maxPooled;
+  }
+
+  /**
+   * Size of pooled buffers in bytes
+   */
+  getBufferBytes(): number {
+    return this.bufferBytes;
+  }
+
+  /**
+   * Get a buffer from the pool (allocates if the pool is empty)
+   */
+  acquire(): Buffer {
+    return this.free.pop() ?? Buffer.allocUnsafe(this.bufferBytes);
+  }
+
+  /**
+   * Return a buffer to the pool
+   * Buffers of a different size (e.g. grown for long utterances) are dropped
+   */
+  release(buffer: Buffer): void {
+    if (buffer.length === this.bufferBytes && this.free.length < this.maxPooled) {
+      this.free.push(buffer);
+    }
+  }
+}
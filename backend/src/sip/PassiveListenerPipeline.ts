@@ -1,10 +1,51 @@
 import { EventEmitter } from 'events';
 import type { ProviderRegistry } from '../providers/ProviderRegistry';
 import type { ISTTProvider } from '../providers/ai/ISTTProvider';
+import type { TranscribedWord } from '../providers/ai/IAIProvider';
 import type { IDenoiserProvider } from '../providers/audio/IDenoiserProvider';
 import { RTPAudioHandler } from './RTPAudioHandler';
 import { VADBuffer, type VADBufferOptions } from './VADBuffer';
-import { pcmToWav } from './AudioUtils';
+import { containsSpeech, type SpeechGateOptions } from './AudioUtils';
+import { STTBatcher, getSTTBatcher } from './STTBatcher';
+
+/**
+ * Known Whisper hallucinations (common artifacts from silence/noise), lowercase
+ */
+const WHISPER_HALLUCINATIONS = [
+  'untertitel',
+  'amara.org',
+  'untertitelung aufgrund der audioqualität nicht möglich',
+  'vielen dank für ihre aufmerksamkeit',
+  'vielen dank für die aufmerksamkeit',
+  "vielen dank für's zuhören",
+  'vielen dank fürs zuhören',
+  'bis zum nächsten mal',
+  'thank you for watching',
+  'thanks for watching',
+  'subscribe',
+  'like and subscribe',
+  'copyright',
+  'www.',
+  'http'
+];
+
+/**
+ * Streaming: audio kept before the last committed word when the decoded prefix is trimmed
+ * (Whisper word timestamps are not sample-exact)
+ */
+const STREAM_OVERLAP_SEC = 0.5;
+
+/**
+ * Streaming: committed words compared against the start of a new hypothesis
+ */
+const STREAM_OVERLAP_WORDS = 5;
+
+/**
+ * Normalize a word for comparison between hypotheses (case and punctuation vary)
+ */
+function normalizeWord(word: string): string {
+  return word.toLowerCase().replace(/[^\p{L}\p{N}]/gu, '');
+}
 
 export interface PassiveListenerOptions {
   /**
@@ -37,6 +78,37 @@ export interface PassiveListenerOptions {
    * Set to 'none' or omit to disable noise suppression
    */
   denoiserProvider?: string;
+
+  /**
+   * Streaming transcription (LocalAgreement-2) instead of one request per utterance
+   * Words are emitted as soon as two consecutive decodes agree on them (default: false)
+   */
+  streamingTranscription?: boolean;
+
+  /**
+   * Streaming: re-transcribe after this much new audio (default: 500ms)
+   */
+  streamingStepMs?: number;
+
+  /**
+   * Streaming: maximum decode window (default: 15000ms)
+   * If two hypotheses do not agree within it, all but the last word are committed
+   */
+  streamingBufferMs?: number;
+}
+
+/**
+ * Streaming state of one VAD utterance
+ * Timestamps are seconds relative to the first buffered byte
+ */
+interface StreamSegment {
+  chunks: Buffer[];
+  bytes: number;
+  bytesSinceDecode: number;
+  decodeQueued: boolean;
+  committedEnd: number; // End of the last committed word
+  committedTail: string[]; // Last committed words (normalized)
+  hypothesis: TranscribedWord[]; // Unconfirmed words of the previous decode
 }
 
 interface TranscriptionEvent {
@@ -58,22 +130,31 @@ interface TranscriptionEvent {
  * - Sends silence/comfort noise to keep RTP alive
  * - Transcribes audio using STT
  * - Streams live transcripts via events
+ * - Optional streaming mode: partial transcripts while the speaker is still talking
  * - No LLM/TTS - purely passive
  */
 export class PassiveListenerPipeline extends EventEmitter {
   private registry: ProviderRegistry;
   private sttProvider: ISTTProvider;
+  private sttBatcher: STTBatcher;
   private denoiserProvider: IDenoiserProvider | null = null;
   private rtpHandler: RTPAudioHandler;
   private vadBuffer: VADBuffer;
+  private speechGate: SpeechGateOptions;
   private callId: string;
   private options: PassiveListenerOptions;
 
   private isStopped: boolean = false;
   private comfortNoiseInterval: NodeJS.Timeout | null = null;
+  private audioQueue: Promise<void> = Promise.resolve();
+  private transcriptOrder: Promise<void> = Promise.resolve();
   private transcriptionCount: number = 0;
   private startTime: Date;
 
+  // Streaming transcription state (LocalAgreement-2)
+  private stream: StreamSegment = this.createStreamSegment();
+  private streamQueue: Promise<void> = Promise.resolve();
+
   private readonly SAMPLE_RATE = 8000;
 
   constructor(
@@ -91,6 +172,9 @@ export class PassiveListenerPipeline extends EventEmitter {
       language: 'de',
       sendComfortNoise: true,
       comfortNoiseIntervalMs: 20,
+      streamingTranscription: false,
+      streamingStepMs: 500,
+      streamingBufferMs: 15000,
       ...options
     };
     this.startTime = new Date();
@@ -98,6 +182,15 @@ export class PassiveListenerPipeline extends EventEmitter {
     // Get STT provider
     const sttName = this.options.sttProvider || 'openai';
     this.sttProvider = registry.getSTT(sttName);
+    this.sttBatcher = getSTTBatcher(this.sttProvider);
+
+    // Streaming needs word timestamps to trim the decoded audio
+    if (this.options.streamingTranscription && !this.sttProvider.transcribeWords) {
+      console.warn(
+        `[PassiveListener:${callId}] STT provider ${sttName} has no word timestamps, streaming disabled`
+      );
+      this.options.streamingTranscription = false;
+    }
 
     // Get Denoiser provider if specified and not 'none'
     const denoiserName = this.options.denoiserProvider;
@@ -119,9 +212,15 @@ export class PassiveListenerPipeline extends EventEmitter {
     };
     this.vadBuffer = new VADBuffer(callId, vadOptions);
 
+    // Speech must reach the level the VAD treats as non-silent
+    this.speechGate = { sampleRate: this.SAMPLE_RATE, minRmsDb: vadOptions.silenceThresholdDb };
+
     const denoiserInfo = this.denoiserProvider ? `, denoiser=${this.denoiserProvider.name}` : '';
+    const streamingInfo = this.options.streamingTranscription
+      ? `, streaming=${this.options.streamingStepMs}ms/${this.options.streamingBufferMs}ms`
+      : '';
     console.log(
-      `[PassiveListener:${callId}] Initialized with STT=${sttName}, language=${this.options.language}${denoiserInfo}`
+      `[PassiveListener:${callId}] Initialized with STT=${sttName}, language=${this.options.language}${denoiserInfo}${streamingInfo}`
     );
   }
 
@@ -131,30 +230,77 @@ export class PassiveListenerPipeline extends EventEmitter {
   async start(): Promise<void> {
     console.log(`[PassiveListener:${this.callId}] Starting passive monitoring`);
 
+    // The denoising path is fixed for the whole call: switching from async to sync
+    // once the denoiser has initialized would let packets overtake queued ones
+    const denoiser = this.denoiserProvider;
+    const useSyncDenoiser = Boolean(denoiser?.processSync);
+
     // Listen for incoming audio
-    this.rtpHandler.on('audio', async (audioData: Buffer) => {
-      if (!this.isStopped) {
+    this.rtpHandler.on('audio', (audioData: Buffer) => {
+      if (this.isStopped) return;
+
+      if (!denoiser) {
+        this.ingestAudio(audioData);
+        return;
+      }
+
+      // Synchronous denoising keeps packets in order without yielding to the event loop
+      // (audio passes through unchanged until the denoiser has initialized)
+      if (useSyncDenoiser) {
         let processedAudio = audioData;
+        try {
+          processedAudio = denoiser.processSync!(audioData);
+        } catch (error) {
+          // Graceful degradation: use original audio on error
+          console.error(`[PassiveListener:${this.callId}] Denoise error:`, error);
+        }
+        this.ingestAudio(processedAudio);
+        return;
+      }
 
-        // Apply noise suppression if enabled (per-RTP-packet)
-        if (this.denoiserProvider) {
-          try {
-            processedAudio = await this.denoiserProvider.process(audioData, {
-              sampleRate: this.SAMPLE_RATE
-            });
-          } catch (error) {
-            // Graceful degradation: use original audio on error
-            console.error(`[PassiveListener:${this.callId}] Denoise error:`, error);
+      // Async denoising: chain packets so they reach the VAD in arrival order
+      // Each step catches its own errors, so one failure cannot stall the queue
+      this.audioQueue = this.audioQueue
+        .then(async () => {
+          if (this.isStopped) return;
+          let processedAudio = audioData;
+          // Like processSync(), pass audio through until the denoiser has initialized
+          if (denoiser.initialized) {
+            try {
+              processedAudio = await denoiser.process(audioData, {
+                sampleRate: this.SAMPLE_RATE
+              });
+            } catch (error) {
+              // Graceful degradation: use original audio on error
+              console.error(`[PassiveListener:${this.callId}] Denoise error:`, error);
+            }
           }
-        }
+          this.ingestAudio(processedAudio);
+        })
+        .catch((error) => {
+          console.error(`[PassiveListener:${this.callId}] Audio processing error:`, error);
+        });
+    });
 
-        this.vadBuffer.ingest(processedAudio);
+    // Handle complete utterances from VAD
+    this.vadBuffer.on('utterance', async (audioData: Buffer, release: () => void) => {
+      try {
+        if (this.options.streamingTranscription) {
+          await this.finishStreaming();
+        } else {
+          await this.transcribeInOrder(audioData);
+        }
+      } finally {
+        // Return the pooled capture buffer to the VAD
+        release();
       }
     });
 
-    // Handle complete utterances from VAD
-    this.vadBuffer.on('utterance', async (audioData: Buffer) => {
-      await this.transcribeUtterance(audioData);
+    // Short noise burst dropped by the VAD: drop its stream audio too
+    this.vadBuffer.on('discard', () => {
+      if (this.options.streamingTranscription) {
+        this.stream = this.createStreamSegment();
+      }
     });
 
     // Start sending comfort noise to keep RTP alive
@@ -171,10 +317,47 @@ export class PassiveListenerPipeline extends EventEmitter {
     console.log(`[PassiveListener:${this.callId}] Monitoring active`);
   }
 
+  /**
+   * Feed (denoised) audio into the VAD and the streaming transcriber
+   */
+  private ingestAudio(audioData: Buffer): void {
+    if (this.isStopped) return;
+
+    this.vadBuffer.ingest(audioData);
+
+    if (this.options.streamingTranscription) {
+      this.ingestStreaming(audioData);
+    }
+  }
+
+  /**
+   * Transcribe an utterance (batched with utterances of other calls)
+   * Transcripts are emitted in speaking order, even if requests finish out of order
+   */
+  private async transcribeInOrder(audioData: Buffer): Promise<void> {
+    const previous = this.transcriptOrder;
+    let emitted!: () => void;
+    this.transcriptOrder = new Promise<void>((resolve) => (emitted = resolve));
+
+    try {
+      const event = await this.transcribeUtterance(audioData);
+
+      await previous;
+      if (event) {
+        this.transcriptionCount++;
+        console.log(`[PassiveListener:${this.callId}] Transcript: "${event.text}"`);
+        this.emit('transcription', event);
+      }
+    } finally {
+      emitted();
+    }
+  }
+
   /**
    * Transcribe a complete utterance
+   * @returns Transcription event, or null if there is nothing to emit
    */
-  private async transcribeUtterance(audioData: Buffer): Promise<void> {
+  private async transcribeUtterance(audioData: Buffer): Promise<TranscriptionEvent | null> {
     try {
       const durationMs = (audioData.length / 2 / this.SAMPLE_RATE) * 1000;
 
@@ -183,70 +366,261 @@ export class PassiveListenerPipeline extends EventEmitter {
         console.log(
           `[PassiveListener:${this.callId}] Skipping short audio: ${durationMs.toFixed(0)}ms (min 150ms)`
         );
-        return;
+        return null;
       }
 
-      // Convert PCM to WAV for STT
-      const wavBuffer = pcmToWav(audioData, this.SAMPLE_RATE);
+      // Skip clicks and noise that passed the VAD without an STT request
+      if (!containsSpeech(audioData, this.speechGate)) {
+        console.log(
+          `[PassiveListener:${this.callId}] No speech in ${durationMs.toFixed(0)}ms of audio, skipping`
+        );
+        return null;
+      }
 
       console.log(
         `[PassiveListener:${this.callId}] Transcribing ${durationMs.toFixed(0)}ms of audio`
       );
 
-      // Transcribe
-      const text = await this.sttProvider.transcribe(wavBuffer, {
-        language: this.options.language || 'de'
-      });
+      // Raw PCM, possibly joined with utterances of other calls into one request
+      const text = await this.sttBatcher.transcribe(audioData, this.options.language || 'de');
 
       if (text && text.trim()) {
         const trimmedText = text.trim();
 
-        // Filter known Whisper hallucinations (common artifacts from silence/noise)
-        const hallucinations = [
-          'untertitel',
-          'amara.org',
-          'untertitelung aufgrund der audioqualität nicht möglich',
-          'vielen dank für ihre aufmerksamkeit',
-          'vielen dank für die aufmerksamkeit',
-          "vielen dank für's zuhören",
-          'vielen dank fürs zuhören',
-          'bis zum nächsten mal',
-          'thank you for watching',
-          'thanks for watching',
-          'subscribe',
-          'like and subscribe',
-          'copyright',
-          'www.',
-          'http'
-        ];
-
-        const lowerText = trimmedText.toLowerCase();
-        const isHallucination = hallucinations.some(h => lowerText.includes(h));
-
-        if (isHallucination) {
+        if (this.isHallucination(trimmedText)) {
           console.log(`[PassiveListener:${this.callId}] Filtered hallucination: "${trimmedText}"`);
-          return;
+          return null;
         }
 
-        this.transcriptionCount++;
-
-        const event: TranscriptionEvent = {
+        return {
           callId: this.callId,
           text: trimmedText,
           timestamp: new Date(),
           isFinal: true,
           durationMs
         };
-
-        console.log(`[PassiveListener:${this.callId}] Transcript: "${trimmedText}"`);
-
-        // Emit transcription event
-        this.emit('transcription', event);
       }
     } catch (error) {
       console.error(`[PassiveListener:${this.callId}] Transcription error:`, error);
       this.emit('error', { callId: this.callId, error });
     }
+    return null;
+  }
+
+  /**
+   * Filter known Whisper hallucinations (see WHISPER_HALLUCINATIONS)
+   */
+  private isHallucination(text: string): boolean {
+    const lowerText = text.toLowerCase();
+    return WHISPER_HALLUCINATIONS.some(h => lowerText.includes(h));
+  }
+
+  /**
+   * Streaming: collect speech audio and re-transcribe every step
+   *
+   * LocalAgreement-2: the utterance buffer is transcribed every
+   * streamingStepMs, and only the words two consecutive hypotheses agree on
+   * are committed (isFinal: true). The unconfirmed tail is emitted as a
+   * partial transcript (isFinal: false) and may still change.
+   *
+   * After each commit the audio up to the last committed word (minus a short
+   * overlap) is dropped, so every decode only covers the unconfirmed speech.
+   */
+  private ingestStreaming(audioData: Buffer): void {
+    // Only buffer while the VAD is inside an utterance (its end flushes the stream)
+    if (!this.vadBuffer.isInSpeech()) {
+      return;
+    }
+
+    const segment = this.stream;
+    segment.chunks.push(audioData);
+    segment.bytes += audioData.length;
+    segment.bytesSinceDecode += audioData.length;
+
+    const bytesPerMs = (this.SAMPLE_RATE * 2) / 1000;
+    const stepBytes = this.options.streamingStepMs! * bytesPerMs;
+
+    // Wait for at least one second of audio and one step of new audio, one decode at a time
+    if (
+      segment.bytes < 1000 * bytesPerMs ||
+      segment.bytesSinceDecode < stepBytes ||
+      segment.decodeQueued
+    ) {
+      return;
+    }
+
+    segment.bytesSinceDecode = 0;
+    segment.decodeQueued = true;
+    this.enqueueStreaming(async () => {
+      segment.decodeQueued = false;
+      await this.decodeStreaming(segment, false);
+    });
+  }
+
+  /**
+   * Streaming: end of utterance - transcribe the remaining segment and commit the tail
+   * (the VAD utterance itself is not used, parts of it may already be committed)
+   */
+  private async finishStreaming(): Promise<void> {
+    const segment = this.stream;
+    this.stream = this.createStreamSegment();
+    await this.enqueueStreaming(() => this.decodeStreaming(segment, true));
+  }
+
+  /**
+   * Run streaming work strictly in order (decodes of one call never overlap)
+   */
+  private enqueueStreaming(task: () => Promise<void>): Promise<void> {
+    this.streamQueue = this.streamQueue.then(task).catch((error) => {
+      console.error(`[PassiveListener:${this.callId}] Streaming transcription error:`, error);
+      this.emit('error', { callId: this.callId, error });
+    });
+    return this.streamQueue;
+  }
+
+  private createStreamSegment(): StreamSegment {
+    return {
+      chunks: [],
+      bytes: 0,
+      bytesSinceDecode: 0,
+      decodeQueued: false,
+      committedEnd: 0,
+      committedTail: [],
+      hypothesis: []
+    };
+  }
+
+  /**
+   * Transcribe the segment and emit newly confirmed words
+   * @param isFinal - End of segment: commit all remaining words
+   */
+  private async decodeStreaming(segment: StreamSegment, isFinal: boolean): Promise<void> {
+    // Finished or discarded meanwhile: the final decode (if any) covers this audio
+    if (!isFinal && segment !== this.stream) {
+      return;
+    }
+
+    const audioData = Buffer.concat(segment.chunks, segment.bytes);
+    const durationMs = (audioData.length / 2 / this.SAMPLE_RATE) * 1000;
+    let words: TranscribedWord[] = [];
+
+    if (durationMs >= 150 && containsSpeech(audioData, this.speechGate)) {
+      const decoded = await this.sttProvider.transcribeWords!(audioData, {
+        language: this.options.language || 'de',
+        sampleRate: this.SAMPLE_RATE
+      });
+      words = this.dropCommittedWords(segment, decoded);
+    }
+
+    if (isFinal) {
+      this.emitStreamingWords(words.map(({ word }) => word), true, durationMs);
+      return;
+    }
+
+    // Longest common prefix of the last two hypotheses (compared by content)
+    let agreed = 0;
+    while (
+      agreed < words.length &&
+      agreed < segment.hypothesis.length &&
+      normalizeWord(words[agreed].word) === normalizeWord(segment.hypothesis[agreed].word)
+    ) {
+      agreed++;
+    }
+
+    // Window full without agreement: commit all but the last (possibly cut off) word
+    const maxBytes = ((this.options.streamingBufferMs! * this.SAMPLE_RATE) / 1000) * 2;
+    if (audioData.length >= maxBytes) {
+      agreed = Math.max(agreed, words.length - 1);
+    }
+
+    const committed = words.slice(0, agreed);
+    segment.hypothesis = words.slice(agreed);
+
+    if (committed.length > 0) {
+      this.emitStreamingWords(committed.map(({ word }) => word), true, durationMs);
+      segment.committedEnd = committed[committed.length - 1].end;
+      segment.committedTail = [...segment.committedTail, ...committed.map(({ word }) => normalizeWord(word))]
+        .slice(-STREAM_OVERLAP_WORDS);
+      this.trimStreamSegment(segment, segment.committedEnd - STREAM_OVERLAP_SEC);
+    }
+
+    this.emitStreamingWords(segment.hypothesis.map(({ word }) => word), false);
+  }
+
+  /**
+   * Drop words of a new hypothesis that belong to already committed audio
+   * (decoded again from the overlap kept before the committed end)
+   */
+  private dropCommittedWords(segment: StreamSegment, words: TranscribedWord[]): TranscribedWord[] {
+    const fresh = words.filter(({ start, end }) => (start + end) / 2 > segment.committedEnd);
+
+    // Timestamps jitter between decodes: also drop a leading repeat of the last committed words
+    const tail = segment.committedTail;
+    for (let n = Math.min(tail.length, fresh.length); n > 0; n--) {
+      const repeated = fresh
+        .slice(0, n)
+        .every(({ word }, i) => normalizeWord(word) === tail[tail.length - n + i]);
+      if (repeated) {
+        return fresh.slice(n);
+      }
+    }
+    return fresh;
+  }
+
+  /**
+   * Drop audio before cutSec and shift the segment timestamps accordingly
+   */
+  private trimStreamSegment(segment: StreamSegment, cutSec: number): void {
+    const cutBytes = Math.min(Math.floor(cutSec * this.SAMPLE_RATE) * 2, segment.bytes);
+    if (cutBytes <= 0) {
+      return;
+    }
+
+    let remaining = cutBytes;
+    while (remaining > 0) {
+      const first = segment.chunks[0];
+      if (first.length <= remaining) {
+        segment.chunks.shift();
+        remaining -= first.length;
+      } else {
+        segment.chunks[0] = first.subarray(remaining);
+        remaining = 0;
+      }
+    }
+    segment.bytes -= cutBytes;
+
+    const shiftSec = cutBytes / 2 / this.SAMPLE_RATE;
+    segment.committedEnd -= shiftSec;
+    segment.hypothesis = segment.hypothesis.map((word) => ({
+      ...word,
+      start: word.start - shiftSec,
+      end: word.end - shiftSec
+    }));
+  }
+
+  /**
+   * Emit a streaming transcript fragment
+   */
+  private emitStreamingWords(words: string[], isFinal: boolean, durationMs?: number): void {
+    const text = words.join(' ');
+    if (!text || this.isHallucination(text)) {
+      return;
+    }
+
+    if (isFinal) {
+      this.transcriptionCount++;
+      console.log(`[PassiveListener:${this.callId}] Transcript: "${text}"`);
+    }
+
+    const event: TranscriptionEvent = {
+      callId: this.callId,
+      text,
+      timestamp: new Date(),
+      isFinal,
+      durationMs
+    };
+
+    this.emit('transcription', event);
   }
 
   /**
@@ -293,6 +667,7 @@ export class PassiveListenerPipeline extends EventEmitter {
     // Remove listeners
     this.rtpHandler.removeAllListeners('audio');
     this.vadBuffer.removeAllListeners('utterance');
+    this.vadBuffer.removeAllListeners('discard');
 
     const sessionDuration = Date.now() - this.startTime.getTime();
 
@@ -311,6 +686,14 @@ export class PassiveListenerPipeline extends EventEmitter {
     );
   }
 
+  /**
+   * Wait until all started transcriptions have been emitted
+   * (stop() flushes the last utterance, but its transcription completes asynchronously)
+   */
+  async whenIdle(): Promise<void> {
+    await Promise.all([this.transcriptOrder, this.streamQueue]);
+  }
+
   /**
    * Get current stats
    */
@@ -0,0 +1,127 @@
+/**
+ * Playback Queue
+ *
+ * Frame queue between a (streaming) audio producer and RTP playback.
+ * The producer pushes PCM chunks of any size as they arrive, the consumer
+ * pulls fixed-size frames and is woken up as soon as a frame is available.
+ *
+ * Usage:
+ * ```typescript
+ * const queue = new PlaybackQueue(320); // 20ms @ 8kHz, 16-bit
+ *
+ * // Producer
+ * for await (const chunk of ttsStream) queue.push(chunk);
+ * queue.end();
+ *
+ * // Consumer
+ * let frame;
+ * while ((frame = await queue.nextFrame()) !== null) {
+ *   rtpHandler.sendAudio(frame);
+ * }
+ * queue.markPlayed();
+ *
+ * // Anyone waiting for the audio to be heard
+ * await queue.played;
+ * ```
+ */
+export class PlaybackQueue {
+  private frames: Buffer[] = [];
+  private partial: Buffer = Buffer.alloc(0);
+  private ended: boolean = false;
+  private closed: boolean = false;
+  private waiter: (() => void) | null = null;
+  private readonly frameBytes: number;
+  private resolvePlayed!: () => void;
+
+  /**
+   * Resolves once the consumer has played the last frame (or playback was closed)
+   */
+  readonly played: Promise<void>;
+
+  constructor(frameBytes: number = 320) {
+    this.frameBytes = frameBytes;
+    this.played = new Promise<void>((resolve) => {
+      this.resolvePlayed = resolve;
+    });
+  }
+
+  /**
+   * Append PCM audio, split into frames
+   */
+  push(pcmData: Buffer): void {
+    if (this.ended || this.closed || pcmData.length === 0) return;
+
+    const data = this.partial.length > 0 ? Buffer.concat([this.partial, pcmData]) : pcmData;
+    let offset = 0;
+    while (offset + this.frameBytes <= data.length) {
+      this.frames.push(data.subarray(offset, offset + this.frameBytes));
+      offset += this.frameBytes;
+    }
+    this.partial = Buffer.from(data.subarray(offset));
+
+    this.wake();
+  }
+
+  /**
+   * Mark end of stream (pads the last partial frame with silence)
+   */
+  end(): void {
+    if (this.ended) return;
+
+    if (this.partial.length > 0 && !this.closed) {
+      const lastFrame = Buffer.alloc(this.frameBytes);
+      this.partial.copy(lastFrame);
+      this.frames.push(lastFrame);
+      this.partial = Buffer.alloc(0);
+    }
+
+    this.ended = true;
+    this.wake();
+  }
+
+  /**
+   * Stop playback early and drop queued audio (e.g. on interrupt)
+   * The producer should check isClosed() and stop producing
+   */
+  close(): void {
+    this.closed = true;
+    this.frames = [];
+    this.partial = Buffer.alloc(0);
+    this.end();
+    this.resolvePlayed();
+  }
+
+  /**
+   * Signal that all frames have been played out (called by the consumer)
+   */
+  markPlayed(): void {
+    this.resolvePlayed();
+  }
+
+  /**
+   * Check if the consumer stopped reading
+   */
+  isClosed(): boolean {
+    return this.closed;
+  }
+
+  /**
+   * Get the next frame, waiting for the producer if necessary
+   * @returns Frame buffer, or null once the stream has ended and drained
+   */
+  async nextFrame(): Promise<Buffer | null> {
+    while (this.frames.length === 0) {
+      if (this.ended) return null;
+      await new Promise<void>((resolve) => {
+        this.waiter = resolve;
+      });
+    }
+    return this.frames.shift()!;
+  }
+
+  private wake(): void {
+    const waiter = this.waiter;
+    this.waiter = null;
+    waiter?.();
+  }
+}
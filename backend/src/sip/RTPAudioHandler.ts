@@ -1,11 +1,13 @@
 import dgram from 'dgram';
 import { EventEmitter } from 'events';
+import { pcmSamples, samplesToPcm } from './AudioUtils';
 
 // G.711 μ-law encoding/decoding (inline to avoid external dependency)
 function encodePCMU(input: Buffer): Buffer {
-  const out = Buffer.alloc(input.length / 2);
-  for (let i = 0, o = 0; i < input.length; i += 2, o++) {
-    let sample = input.readInt16LE(i);
+  const samples = pcmSamples(input);
+  const out = Buffer.alloc(samples.length);
+  for (let o = 0; o < samples.length; o++) {
+    let sample = samples[o];
     const sign = sample < 0 ? 0x80 : 0x00;
     if (sample < 0) sample = -sample;
     if (sample > 32635) sample = 32635;
@@ -21,8 +23,8 @@ function encodePCMU(input: Buffer): Buffer {
 }
 
 function decodePCMU(input: Buffer): Buffer {
-  const out = Buffer.alloc(input.length * 2);
-  for (let i = 0, o = 0; i < input.length; i++, o += 2) {
+  const out = new Int16Array(input.length);
+  for (let i = 0; i < input.length; i++) {
     let uVal = ~input[i] & 0xff;
     const sign = uVal & 0x80;
     const exponent = (uVal >> 4) & 0x07;
@@ -30,9 +32,9 @@ function decodePCMU(input: Buffer): Buffer {
     let sample = ((mantissa << 3) + 0x84) << exponent;
     sample -= 0x84;
     if (sign !== 0) sample = -sample;
-    out.writeInt16LE(sample, o);
+    out[i] = sample;
   }
-  return out;
+  return samplesToPcm(out);
 }
 
 /**
@@ -287,20 +289,19 @@ export class RTPAudioHandler extends EventEmitter {
   }
 
   private encodePCMA(input: Buffer): Buffer {
-    const out = Buffer.alloc(input.length / 2);
-    for (let i = 0, o = 0; i < input.length; i += 2, o++) {
-      const sample = input.readInt16LE(i);
-      out[o] = this.linearToALawSample(sample);
+    const samples = pcmSamples(input);
+    const out = Buffer.alloc(samples.length);
+    for (let o = 0; o < samples.length; o++) {
+      out[o] = this.linearToALawSample(samples[o]);
     }
     return out;
   }
 
   private decodePCMA(input: Buffer): Buffer {
-    const out = Buffer.alloc(input.length * 2);
-    for (let i = 0, o = 0; i < input.length; i++, o += 2) {
-      const sample = this.aLawToLinearSample(input[i]);
-      out.writeInt16LE(sample, o);
+    const out = new Int16Array(input.length);
+    for (let i = 0; i < input.length; i++) {
+      out[i] = this.aLawToLinearSample(input[i]);
     }
-    return out;
+    return samplesToPcm(out);
   }
 }
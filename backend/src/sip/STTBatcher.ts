@@ -0,0 +1,163 @@
+/**
+ * STT Batcher
+ *
+ * Collects utterances from all calls for a short window and transcribes them
+ * together. With many simultaneous calls, short utterances otherwise each pay
+ * the full per-request overhead (upload, queueing, model warm-up).
+ *
+ * If the provider returns word timestamps, the utterances of a batch are
+ * joined into one request (separated by silence) and the words are split back
+ * per utterance by their timestamps (split transcripts carry no punctuation,
+ * as word timestamps do not include it). Otherwise the batch is dispatched
+ * concurrently (rate limited by the provider's RequestScheduler).
+ *
+ * Entries are raw 16-bit mono PCM at the configured sample rate.
+ */
+
+import type { ISTTProvider } from '../providers/ai/ISTTProvider';
+
+export interface STTBatcherOptions {
+  /**
+   * Time to wait for more utterances after the first one (default: 50ms)
+   */
+  windowMs?: number;
+
+  /**
+   * Maximum utterances per batch (default: 8)
+   */
+  maxBatchSize?: number;
+
+  /**
+   * Silence between joined utterances (default: 500ms)
+   */
+  gapMs?: number;
+
+  /**
+   * Sample rate of the PCM input (default: 8000)
+   */
+  sampleRate?: number;
+}
+
+interface PendingUtterance {
+  audio: Buffer;
+  resolve: (text: string) => void;
+  reject: (error: unknown) => void;
+}
+
+export class STTBatcher {
+  private readonly windowMs: number;
+  private readonly maxBatchSize: number;
+  private readonly gapMs: number;
+  private readonly sampleRate: number;
+
+  // Utterances are only batched with others of the same language
+  private pending: Map<string, PendingUtterance[]> = new Map();
+  private timers: Map<string, NodeJS.Timeout> = new Map();
+
+  constructor(
+    private sttProvider: ISTTProvider,
+    options: STTBatcherOptions = {}
+  ) {
+    this.windowMs = options.windowMs ?? 50;
+    this.maxBatchSize = options.maxBatchSize ?? 8;
+    this.gapMs = options.gapMs ?? 500;
+    this.sampleRate = options.sampleRate ?? 8000;
+  }
+
+  /**
+   * Transcribe an utterance as part of the next batch
+   * @param audio - Raw PCM (must stay valid until the promise settles)
+   * @param language - Transcription language
+   */
+  transcribe(audio: Buffer, language: string): Promise<string> {
+    return new Promise((resolve, reject) => {
+      const queue = this.pending.get(language) ?? [];
+      this.pending.set(language, queue);
+      queue.push({ audio, resolve, reject });
+
+      if (queue.length >= this.maxBatchSize) {
+        this.dispatch(language);
+      } else if (!this.timers.has(language)) {
+        this.timers.set(language, setTimeout(() => this.dispatch(language), this.windowMs));
+      }
+    });
+  }
+
+  private dispatch(language: string): void {
+    const timer = this.timers.get(language);
+    if (timer) {
+      clearTimeout(timer);
+      this.timers.delete(language);
+    }
+
+    const batch = this.pending.get(language);
+    this.pending.delete(language);
+    if (!batch || batch.length === 0) return;
+
+    if (batch.length === 1 || !this.sttProvider.transcribeWords) {
+      for (const utterance of batch) {
+        this.sttProvider
+          .transcribe(utterance.audio, { language, sampleRate: this.sampleRate })
+          .then(utterance.resolve, utterance.reject);
+      }
+      return;
+    }
+
+    console.log(`[STTBatcher] Transcribing ${batch.length} utterances in one request`);
+    this.transcribeJoined(batch, language).then(
+      (texts) => batch.forEach((utterance, i) => utterance.resolve(texts[i])),
+      (error) => batch.forEach((utterance) => utterance.reject(error))
+    );
+  }
+
+  /**
+   * Transcribe the batch as one audio file and split the words back per utterance
+   */
+  private async transcribeJoined(batch: PendingUtterance[], language: string): Promise<string[]> {
+    const gapSec = this.gapMs / 1000;
+    const gap = Buffer.alloc(Math.round(this.sampleRate * gapSec) * 2);
+    const parts: Buffer[] = [];
+    const ends: number[] = []; // End of each utterance in the joined audio (seconds)
+    let offsetSec = 0;
+
+    batch.forEach((utterance, i) => {
+      if (i > 0) {
+        parts.push(gap);
+        offsetSec += gapSec;
+      }
+      parts.push(utterance.audio);
+      offsetSec += utterance.audio.length / 2 / this.sampleRate;
+      ends.push(offsetSec);
+    });
+
+    const words = await this.sttProvider.transcribeWords!(Buffer.concat(parts), {
+      language,
+      sampleRate: this.sampleRate
+    });
+
+    // A word belongs to the utterance it overlaps most, i.e. up to the middle of the following gap
+    const texts: string[][] = batch.map(() => []);
+    for (const { word, start, end } of words) {
+      const middle = (start + end) / 2;
+      let index = ends.findIndex((utteranceEnd) => middle < utteranceEnd + gapSec / 2);
+      if (index < 0) index = batch.length - 1;
+      texts[index].push(word);
+    }
+
+    return texts.map((utteranceWords) => utteranceWords.join(' '));
+  }
+}
+
+const batchers: WeakMap<ISTTProvider, STTBatcher> = new WeakMap();
+
+/**
+ * Get the shared batcher for an STT provider (one per provider, across all calls)
+ */
+export function getSTTBatcher(sttProvider: ISTTProvider): STTBatcher {
+  let batcher = batchers.get(sttProvider);
+  if (!batcher) {
+    batcher = new STTBatcher(sttProvider);
+    batchers.set(sttProvider, batcher);
+  }
+  return batcher;
+}
@@ -0,0 +1,168 @@
+/**
+ * TTS Cache
+ *
+ * Content-addressed cache for synthesized speech. Scripted prompts like the
+ * greeting are byte-identical on every call, so they are synthesized once and
+ * replayed from memory (and optionally from disk across restarts) instead of
+ * paying a TTS round trip per call.
+ *
+ * Entries are stored as ready-to-play 8kHz 16-bit mono PCM.
+ */
+
+import { createHash } from 'crypto';
+import { promises as fs } from 'fs';
+import * as path from 'path';
+import type { ITTSProvider } from '../providers/ai/ITTSProvider';
+import type { SynthesizeOptions } from '../providers/ai/IAIProvider';
+import { env } from '../config/env';
+import { mp3ToPcm8k, createPcmResampler } from './AudioUtils';
+
+export interface TTSCacheOptions {
+  /**
+   * In-memory entries (least recently used are evicted, default: 128)
+   */
+  maxEntries?: number;
+
+  /**
+   * Directory for persistent .pcm files (omit for memory only)
+   */
+  cacheDir?: string;
+}
+
+/**
+ * Synthesize text completely and convert it to 8kHz PCM
+ */
+export async function synthesizePcm8k(
+  ttsProvider: ITTSProvider,
+  text: string,
+  options: SynthesizeOptions
+): Promise<Buffer> {
+  if (ttsProvider.synthesizeStream && ttsProvider.streamSampleRate) {
+    const resample = createPcmResampler(ttsProvider.streamSampleRate, 8000);
+    const chunks: Buffer[] = [];
+    for await (const chunk of ttsProvider.synthesizeStream(text, options)) {
+      chunks.push(resample(chunk));
+    }
+    return Buffer.concat(chunks);
+  }
+
+  return mp3ToPcm8k(await ttsProvider.synthesize(text, options));
+}
+
+export class TTSCache {
+  private entries: Map<string, Buffer> = new Map();
+  private readonly maxEntries: number;
+  private readonly cacheDir?: string;
+
+  constructor(options: TTSCacheOptions = {}) {
+    this.maxEntries = options.maxEntries ?? 128;
+    this.cacheDir = options.cacheDir;
+  }
+
+  /**
+   * Cache key: sha256 over everything that changes the audio
+   * (including the provider's own voice configuration, e.g. the configured Piper voice)
+   */
+  static key(text: string, ttsProvider: ITTSProvider, options: SynthesizeOptions): string {
+    return createHash('sha256')
+      .update(
+        `${text}|${options.voice}|${ttsProvider.name}|${ttsProvider.voiceId ?? ''}|${options.speed ?? 1}`
+      )
+      .digest('hex');
+  }
+
+  /**
+   * Look up cached PCM (memory first, then disk)
+   */
+  async get(key: string): Promise<Buffer | null> {
+    const cached = this.entries.get(key);
+    if (cached) {
+      // Move to the end of the map (most recently used)
+      this.entries.delete(key);
+      this.entries.set(key, cached);
+      return cached;
+    }
+
+    if (!this.cacheDir) {
+      return null;
+    }
+
+    try {
+      const pcm = await fs.readFile(this.filePath(key));
+      this.remember(key, pcm);
+      return pcm;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Store PCM in memory and (best effort) on disk
+   */
+  async set(key: string, pcm: Buffer): Promise<void> {
+    if (pcm.length === 0) return;
+
+    this.remember(key, pcm);
+
+    if (!this.cacheDir) {
+      return;
+    }
+
+    try {
+      // Write to a temp file first so readers never see partial audio
+      const target = this.filePath(key);
+      const temp = `${target}.${process.pid}.tmp`;
+      await fs.mkdir(this.cacheDir, { recursive: true });
+      await fs.writeFile(temp, pcm);
+      await fs.rename(temp, target);
+    } catch (error) {
+      console.warn('[TTSCache] Failed to write cache file:', error);
+    }
+  }
+
+  /**
+   * Pre-synthesize texts that are spoken on (almost) every call
+   */
+  async warmUp(ttsProvider: ITTSProvider, texts: string[], options: SynthesizeOptions): Promise<void> {
+    for (const text of texts) {
+      const key = TTSCache.key(text, ttsProvider, options);
+      if (await this.get(key)) continue;
+
+      try {
+        await this.set(key, await synthesizePcm8k(ttsProvider, text, options));
+        console.log(`[TTSCache] Warmed up: "${text}"`);
+      } catch (error) {
+        console.warn(`[TTSCache] Warm-up failed for "${text}":`, error);
+      }
+    }
+  }
+
+  private remember(key: string, pcm: Buffer): void {
+    this.entries.delete(key);
+    this.entries.set(key, pcm);
+
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+    }
+  }
+
+  private filePath(key: string): string {
+    return path.join(this.cacheDir!, `${key}.pcm`);
+  }
+}
+
+let ttsCache: TTSCache | null = null;
+
+/**
+ * Get the shared TTS cache (configured from environment)
+ */
+export function getTTSCache(): TTSCache {
+  if (!ttsCache) {
+    ttsCache = new TTSCache({
+      maxEntries: env.TTS_CACHE_ENTRIES,
+      cacheDir: env.TTS_CACHE_DIR
+    });
+  }
+  return ttsCache;
+}
@@ -1,4 +1,12 @@
 import { EventEmitter } from 'events';
+import { CaptureBufferPool } from './CaptureBufferPool';
+import { pcmSamples } from './AudioUtils';
+
+/**
+ * Pooled capture buffer size: 64KB = ~4s of 8kHz 16-bit audio, enough for most
+ * utterances (longer ones grow a buffer outside the pool)
+ */
+const CAPTURE_BUFFER_BYTES = 65536;
 
 export interface VADBufferOptions {
   sampleRate: number; // e.g., 8000 Hz
@@ -24,11 +32,18 @@ export interface VADBufferOptions {
  *   maxUtteranceDurationMs: 10000
  * });
  *
- * vadBuffer.on('utterance', async (audioData) => {
- *   const transcript = await stt.transcribe(audioData);
- *   console.log(transcript);
+ * vadBuffer.on('utterance', async (audioData, release) => {
+ *   try {
+ *     const transcript = await stt.transcribe(audioData, { language: 'de', sampleRate: 8000 });
+ *     console.log(transcript);
+ *   } finally {
+ *     release(); // audioData is a view into a pooled buffer
+ *   }
  * });
  *
+ * // Speech that was too short to count as an utterance (no audio is emitted)
+ * vadBuffer.on('discard', () => console.log('noise'));
+ *
  * // Feed audio packets (e.g., 20ms RTP packets)
  * rtpHandler.on('audio', (packet) => {
  *   vadBuffer.ingest(packet);
@@ -39,7 +54,9 @@ export interface VADBufferOptions {
  * ```
  */
 export class VADBuffer extends EventEmitter {
-  private buffer: Buffer[] = [];
+  private capture: Buffer | null = null;
+  private captureLength: number = 0;
+  private bufferPool: CaptureBufferPool;
   private silenceBuffer: Buffer[] = [];
   private isInUtterance: boolean = false;
   private utteranceStartTime: number = 0;
@@ -51,6 +68,8 @@ export class VADBuffer extends EventEmitter {
     super();
     this.sessionId = sessionId;
     this.options = options;
+
+    this.bufferPool = new CaptureBufferPool(CAPTURE_BUFFER_BYTES);
   }
 
   /**
@@ -66,9 +85,18 @@ export class VADBuffer extends EventEmitter {
     if (isSilence) {
       this.silenceBuffer.push(audioData);
 
+      // Outside an utterance only keep a short pre-roll of silence
+      if (!this.isInUtterance) {
+        const maxPackets = Math.ceil(this.options.silenceDurationMs / 20);
+        if (this.silenceBuffer.length > maxPackets) {
+          this.silenceBuffer.shift();
+        }
+        return;
+      }
+
       // Check if silence duration exceeds threshold
       const silenceDuration = this.silenceBuffer.length * 20; // 20ms per packet
-      if (silenceDuration >= this.options.silenceDurationMs && this.isInUtterance) {
+      if (silenceDuration >= this.options.silenceDurationMs) {
         // End of utterance detected
         const utteranceDuration = now - this.utteranceStartTime;
 
@@ -81,6 +109,7 @@ export class VADBuffer extends EventEmitter {
           console.log(
             `[VADBuffer:${this.sessionId}] Discarding short utterance (${utteranceDuration}ms < ${this.options.minUtteranceDurationMs}ms)`
           );
+          this.emit('discard');
         }
 
         this.resetUtterance();
@@ -94,12 +123,12 @@ export class VADBuffer extends EventEmitter {
       }
 
       // Include any buffered silence (for natural transitions)
-      if (this.silenceBuffer.length > 0) {
-        this.buffer.push(...this.silenceBuffer);
-        this.silenceBuffer = [];
+      for (const silence of this.silenceBuffer) {
+        this.append(silence);
       }
+      this.silenceBuffer = [];
 
-      this.buffer.push(audioData);
+      this.append(audioData);
 
       // Force flush if utterance is too long (prevent buffer overflow) - only if max duration is configured
       if (this.options.maxUtteranceDurationMs !== undefined) {
@@ -121,15 +150,14 @@ export class VADBuffer extends EventEmitter {
    */
   private detectSilence(audioData: Buffer): boolean {
     // Calculate RMS (Root Mean Square) energy
+    const samples = pcmSamples(audioData); // 16-bit samples (2 bytes per sample)
     let sumSquares = 0;
-    const numSamples = audioData.length / 2; // 16-bit samples (2 bytes per sample)
 
-    for (let i = 0; i < audioData.length; i += 2) {
-      const sample = audioData.readInt16LE(i);
-      sumSquares += sample * sample;
+    for (let i = 0; i < samples.length; i++) {
+      sumSquares += samples[i] * samples[i];
     }
 
-    const rms = Math.sqrt(sumSquares / numSamples);
+    const rms = Math.sqrt(sumSquares / samples.length);
 
     // Convert to decibels (normalize to 16-bit range: -32768 to 32767)
     const db = 20 * Math.log10(rms / 32768);
@@ -137,36 +165,91 @@ export class VADBuffer extends EventEmitter {
     return db < this.options.silenceThresholdDb;
   }
 
+  /**
+   * Copy audio into the pooled capture buffer
+   */
+  private append(audioData: Buffer): void {
+    if (!this.capture) {
+      this.capture = this.bufferPool.acquire();
+      this.captureLength = 0;
+    }
+
+    // Grow (outside the pool) if a long utterance outgrows the buffer
+    if (this.captureLength + audioData.length > this.capture.length) {
+      const grown = Buffer.allocUnsafe(Math.max(this.capture.length * 2, this.captureLength + audioData.length));
+      this.capture.copy(grown, 0, 0, this.captureLength);
+      this.bufferPool.release(this.capture);
+      this.capture = grown;
+    }
+
+    audioData.copy(this.capture, this.captureLength);
+    this.captureLength += audioData.length;
+  }
+
   /**
    * Emit buffered utterance for transcription
+   * Listeners receive a view into a pooled buffer plus a release() callback
+   * to return the buffer once they are done with the audio
    */
   private emitUtterance(): void {
-    if (this.buffer.length === 0) return;
+    if (!this.capture || this.captureLength === 0) return;
 
-    const utterance = Buffer.concat(this.buffer);
+    const capture = this.capture;
+    const utterance = capture.subarray(0, this.captureLength);
     const durationMs = ((utterance.length / 2) / this.options.sampleRate) * 1000;
 
+    // Hand the buffer over to the listeners
+    this.capture = null;
+    this.captureLength = 0;
+
+    let released = false;
+    const release = () => {
+      if (released) return;
+      released = true;
+      this.bufferPool.release(capture);
+    };
+
     console.log(
-      `[VADBuffer:${this.sessionId}] Emitting utterance: ${this.buffer.length} chunks, ${utterance.length} bytes, ${durationMs.toFixed(0)}ms`
+      `[VADBuffer:${this.sessionId}] Emitting utterance: ${utterance.length} bytes, ${durationMs.toFixed(0)}ms`
     );
 
-    this.emit('utterance', utterance);
+    this.emit('utterance', utterance, release);
   }
 
   /**
    * Reset utterance state (start fresh)
    */
   private resetUtterance(): void {
-    this.buffer = [];
+    if (this.capture) {
+      this.bufferPool.release(this.capture);
+      this.capture = null;
+    }
+    this.captureLength = 0;
     this.silenceBuffer = [];
     this.isInUtterance = false;
   }
 
+  /**
+   * Get duration of the utterance currently in progress
+   * Returns 0 while no speech is detected
+   */
+  getActiveUtteranceDurationMs(): number {
+    if (!this.isInUtterance) return 0;
+    return Date.now() - this.utteranceStartTime;
+  }
+
+  /**
+   * Check if speech is currently detected (an utterance is in progress)
+   */
+  isInSpeech(): boolean {
+    return this.isInUtterance;
+  }
+
   /**
    * Flush any remaining buffered audio (call on session end)
    */
   flush(): void {
-    if (this.buffer.length > 0) {
+    if (this.captureLength > 0) {
       console.log(`[VADBuffer:${this.sessionId}] Flushing remaining buffer`);
       this.emitUtterance();
       this.resetUtterance();
@@ -3,9 +3,65 @@ import type { ProviderRegistry } from '../providers/ProviderRegistry';
 import type { ISTTProvider } from '../providers/ai/ISTTProvider';
 import type { ILLMProvider } from '../providers/ai/ILLMProvider';
 import type { ITTSProvider } from '../providers/ai/ITTSProvider';
-import type { ChatMessage } from '../providers/ai/IAIProvider';
+import type { ChatMessage, SynthesizeOptions } from '../providers/ai/IAIProvider';
 import { RTPAudioHandler } from './RTPAudioHandler';
-import { pcmToWav, mp3ToPcm8k } from './AudioUtils';
+import { VADBuffer, type VADBufferOptions } from './VADBuffer';
+import { PlaybackQueue } from './PlaybackQueue';
+import { mp3ToPcm8k, createPcmResampler, containsSpeech, type SpeechGateOptions } from './AudioUtils';
+import { TTSCache, getTTSCache } from './TTSCache';
+
+const GREETING = 'Guten Tag. Willkommen beim Stadtwerk. Möchten Sie Ihren Zählerstand melden?';
+
+const TTS_OPTIONS: SynthesizeOptions = { voice: 'nova', language: 'de' };
+
+const DEFAULT_SYSTEM_PROMPT = `Du bist ein freundlicher Kundenservice-Agent des Stadtwerks.
+
+Ziel: Zählerstand aufnehmen (Zählerwert und Zählernummer).
+
+Ablauf:
+1. Begrüßung: "${GREETING}"
+2. Wenn Kunde bestätigt → direkt nach dem Zählerstand-Wert fragen
+3. Zählerstand erhalten → kurz bestätigen und nach Zählernummer fragen
+4. Zählernummer erhalten → kurz bestätigen und Gespräch beenden
+
+Wichtig:
+- Höre auf den Kunden! Wenn er bereits seine Absicht nennt ("Ich möchte meinen Zählerstand melden"), NICHT nochmal nachfragen, sondern direkt zum nächsten Schritt übergehen
+- Stelle nur eine Frage pro Antwort
+- Keine doppelten Begrüßungen, keine Füllfloskeln
+- Antworte in max. 1-2 kurzen Sätzen
+- Wiederhole erkannte Zahlen zur Bestätigung (z.B. "Zählerstand 12345, verstanden")
+
+Sprich auf Deutsch.`;
+
+const SUMMARY_PROMPT = 'Fasse kurz zusammen:';
+
+/**
+ * Sentence boundary: whitespace after punctuation, or a line break
+ * Requires whitespace after the punctuation so numbers like "12.345" stay intact
+ */
+const SENTENCE_BOUNDARY = /(?<=[.!?])\s+|\n+/;
+
+/**
+ * Split text into sentences for incremental synthesis
+ */
+function splitSentences(text: string): string[] {
+  return text
+    .split(SENTENCE_BOUNDARY)
+    .map((sentence) => sentence.trim())
+    .filter((sentence) => sentence.length > 0);
+}
+
+/**
+ * German filler words that carry no meaning for the LLM ("äh", "ähm", "hm", ...)
+ */
+const FILLER_WORDS = /(^|\s)(ähm?|öhm?|hm+|mhm)[,.]?(?=\s|$)/giu;
+
+/**
+ * Normalize a turn before it goes into the history (fewer prompt tokens)
+ */
+function cleanTurn(text: string): string {
+  return text.replace(FILLER_WORDS, '$1').replace(/\s+/g, ' ').trim();
+}
 
 export interface VoicePipelineOptions {
   /**
@@ -31,12 +87,17 @@ export interface VoicePipelineOptions {
    */
   skipGreeting?: boolean;
 
+  /**
+   * VAD options for end-of-utterance detection
+   */
+  vadOptions?: Partial<VADBufferOptions>;
+
   /**
    * Provider selection - allows runtime switching
    */
   sttProvider?: string; // 'openai' | 'whisper'
   llmProvider?: string; // 'openai' | 'ollama'
-  ttsProvider?: string; // 'openai' | 'coqui'
+  ttsProvider?: string; // 'openai' | 'coqui' | 'piper'
 }
 
 /**
@@ -50,21 +111,32 @@ export class VoiceAgentPipeline extends EventEmitter {
   private llmProvider: ILLMProvider;
   private ttsProvider: ITTSProvider;
   private rtpHandler: RTPAudioHandler;
+  private vadBuffer: VADBuffer;
+  private speechGate: SpeechGateOptions;
   private callId: string;
   private options: VoicePipelineOptions;
 
   private conversationHistory: ChatMessage[] = [];
-  private audioBuffer: Buffer = Buffer.alloc(0);
+  private historySummary: ChatMessage | null = null;
+  private isSummarizing: boolean = false;
+  private pendingUtterance: Buffer | null = null;
   private isProcessing: boolean = false;
   private isSpeaking: boolean = false;
   private isStopped: boolean = false;
+  private currentTurn: Promise<void> = Promise.resolve();
   private shouldInterrupt: boolean = false;
   private speakingStartTime: number = 0;
 
   private readonly SAMPLE_RATE = 8000;
   private readonly LANGUAGE = 'de';
-  private readonly INTERRUPT_THRESHOLD = this.SAMPLE_RATE * 2 * 3; // 3 seconds to interrupt
+  private readonly FRAME_BYTES = 320; // 20ms at 8kHz, 16-bit = 320 bytes
+  private readonly FRAME_MS = 20;
+  private readonly MAX_PLAYBACK_LAG_MS = 60; // Behind schedule by more (TTS underrun): restart the clock
+  private readonly MAX_TTS_LOOKAHEAD = 2; // Sentences synthesized ahead of playback
+  private readonly INTERRUPT_SPEECH_MS = 1000; // 1 second of user speech to interrupt
   private readonly INTERRUPT_COOLDOWN_MS = 1000; // 1 second cooldown before allowing interrupts
+  private readonly MAX_TURNS = 8; // Recent messages kept verbatim in the LLM prompt
+  private readonly SUMMARY_EVERY = 6; // Older messages collected before they are summarized
 
   constructor(
     callId: string,
@@ -87,6 +159,21 @@ export class VoiceAgentPipeline extends EventEmitter {
     this.llmProvider = registry.getLLM(llmName);
     this.ttsProvider = registry.getTTS(ttsName);
 
+    // End the user turn as soon as the caller stops talking instead of
+    // waiting for a fixed amount of audio
+    const vadOptions: VADBufferOptions = {
+      sampleRate: this.SAMPLE_RATE,
+      silenceThresholdDb: -40,
+      silenceDurationMs: 300,
+      minUtteranceDurationMs: 200,
+      maxUtteranceDurationMs: 10000,
+      ...options.vadOptions
+    };
+    this.vadBuffer = new VADBuffer(callId, vadOptions);
+
+    // Speech must reach the level the VAD treats as non-silent
+    this.speechGate = { sampleRate: this.SAMPLE_RATE, minRmsDb: vadOptions.silenceThresholdDb };
+
     console.log(
       `[VoiceAgentPipeline:${callId}] Initialized with STT=${sttName}, LLM=${llmName}, TTS=${ttsName}`
     );
@@ -106,6 +193,11 @@ export class VoiceAgentPipeline extends EventEmitter {
       this.handleIncomingAudio(audioData);
     });
 
+    // Handle complete utterances from VAD
+    this.vadBuffer.on('utterance', (audioData: Buffer, release: () => void) => {
+      this.handleUtterance(audioData, release);
+    });
+
     // In listen-only mode, skip greeting and LLM setup
     if (this.options.listenOnlyMode) {
       console.log(`[VoiceAgentPipeline:${this.callId}] Listen-only mode: only transcribing`);
@@ -113,26 +205,7 @@ export class VoiceAgentPipeline extends EventEmitter {
     }
 
     // Interactive mode: Set system prompt
-    const systemPrompt =
-      this.options.systemPrompt ||
-      `Du bist ein freundlicher Kundenservice-Agent des Stadtwerks.
-
-Ziel: Zählerstand aufnehmen (Zählerwert und Zählernummer).
-
-Ablauf:
-1. Begrüßung: "Guten Tag. Willkommen beim Stadtwerk. Möchten Sie Ihren Zählerstand melden?"
-2. Wenn Kunde bestätigt → direkt nach dem Zählerstand-Wert fragen
-3. Zählerstand erhalten → kurz bestätigen und nach Zählernummer fragen
-4. Zählernummer erhalten → kurz bestätigen und Gespräch beenden
-
-Wichtig:
-- Höre auf den Kunden! Wenn er bereits seine Absicht nennt ("Ich möchte meinen Zählerstand melden"), NICHT nochmal nachfragen, sondern direkt zum nächsten Schritt übergehen
-- Stelle nur eine Frage pro Antwort
-- Keine doppelten Begrüßungen, keine Füllfloskeln
-- Antworte in max. 1-2 kurzen Sätzen
-- Wiederhole erkannte Zahlen zur Bestätigung (z.B. "Zählerstand 12345, verstanden")
-
-Sprich auf Deutsch.`;
+    const systemPrompt = this.options.systemPrompt || DEFAULT_SYSTEM_PROMPT;
 
     this.conversationHistory.push({
       role: 'system',
@@ -154,76 +227,117 @@ Sprich auf Deutsch.`;
    * Send initial greeting
    */
   private async sendGreeting(): Promise<void> {
-    const greeting = 'Guten Tag. Willkommen beim Stadtwerk. Möchten Sie Ihren Zählerstand melden?';
-    this.conversationHistory.push({ role: 'assistant', content: greeting });
-    await this.speak(greeting);
+    this.conversationHistory.push({ role: 'assistant', content: GREETING });
+    await this.speak(GREETING);
+  }
+
+  /**
+   * Pre-synthesize scripted prompts into the TTS cache (call once at service start)
+   */
+  static async warmUpSpeech(registry: ProviderRegistry, ttsProviderName: string): Promise<void> {
+    await getTTSCache().warmUp(registry.getTTS(ttsProviderName), splitSentences(GREETING), TTS_OPTIONS);
   }
 
   /**
    * Handle incoming audio from RTP
    */
   private handleIncomingAudio(audioData: Buffer): void {
-    // ALWAYS buffer incoming audio (full-duplex)
-    this.audioBuffer = Buffer.concat([this.audioBuffer, audioData]);
-
-    // Don't process while already processing
-    if (this.isProcessing) {
+    if (this.isStopped) {
       return;
     }
 
+    // ALWAYS feed the VAD (full-duplex)
+    this.vadBuffer.ingest(audioData);
+
     // Check for interrupt if agent is speaking
-    if (this.isSpeaking) {
+    if (this.isSpeaking && !this.shouldInterrupt) {
       // Only allow interrupts after cooldown period
       const timeSpoken = Date.now() - this.speakingStartTime;
       if (timeSpoken >= this.INTERRUPT_COOLDOWN_MS) {
-        // If user speaks for 3 seconds while agent talks, trigger interrupt
-        if (this.audioBuffer.length >= this.INTERRUPT_THRESHOLD) {
+        // If user keeps speaking while agent talks, trigger interrupt
+        const speechMs = this.vadBuffer.getActiveUtteranceDurationMs();
+        if (speechMs >= this.INTERRUPT_SPEECH_MS) {
           console.log(
-            `[VoiceAgentPipeline:${this.callId}] User interrupting agent, buffer: ${this.audioBuffer.length} bytes`
+            `[VoiceAgentPipeline:${this.callId}] User interrupting agent after ${speechMs}ms of speech`
           );
           this.shouldInterrupt = true;
-          return;
         }
       }
     }
+  }
+
+  /**
+   * Handle a complete utterance detected by the VAD
+   * audioData is a view into a pooled VAD buffer, release() hands it back
+   */
+  private handleUtterance(audioData: Buffer, release: () => void): void {
+    if (this.isStopped) {
+      release();
+      return;
+    }
 
-    // VAD: Check if we have enough audio (2 seconds)
-    const minBufferSize = this.SAMPLE_RATE * 2 * 2; // 2 seconds, 16-bit samples
+    // Ignore short noises while the agent talks (interrupts are handled separately)
+    if (this.isSpeaking && !this.shouldInterrupt) {
+      console.log(`[VoiceAgentPipeline:${this.callId}] Ignoring utterance during playback`);
+      release();
+      return;
+    }
 
-    if (this.audioBuffer.length >= minBufferSize) {
-      // Process the buffered audio
-      this.processAudioBuffer();
+    // Keep audio that arrives while a turn is in flight for the next turn (copied out of the pool)
+    if (this.isProcessing) {
+      this.pendingUtterance = this.pendingUtterance
+        ? Buffer.concat([this.pendingUtterance, audioData])
+        : Buffer.from(audioData);
+      release();
+      return;
     }
+
+    this.startTurn(audioData, release);
   }
 
   /**
-   * Process accumulated audio buffer
+   * Start processing an utterance, tracked for whenIdle()
    */
-  private async processAudioBuffer(): Promise<void> {
-    if (this.isProcessing || this.audioBuffer.length === 0) {
+  private startTurn(audioData: Buffer, release?: () => void): void {
+    this.currentTurn = this.processUtterance(audioData, release);
+  }
+
+  /**
+   * Process a complete user utterance
+   * @param release - Called once the audio is no longer needed (after transcription)
+   */
+  private async processUtterance(audioToProcess: Buffer, release: () => void = () => {}): Promise<void> {
+    if (this.isProcessing || audioToProcess.length === 0) {
+      release();
+      return;
+    }
+
+    // Skip clicks and noise that passed the VAD without an STT request
+    if (!containsSpeech(audioToProcess, this.speechGate)) {
+      console.log(`[VoiceAgentPipeline:${this.callId}] No speech in utterance, skipping STT`);
+      release();
       return;
     }
 
     this.isProcessing = true;
 
     try {
-      const audioToProcess = this.audioBuffer;
-      this.audioBuffer = Buffer.alloc(0); // Clear buffer
-
-      // Convert PCM to WAV for STT (some providers need WAV format)
-      const wavBuffer = pcmToWav(audioToProcess, this.SAMPLE_RATE);
-
-      // Transcribe
+      // Transcribe raw PCM (providers add the WAV header without copying the audio)
       console.log(
         `[VoiceAgentPipeline:${this.callId}] Transcribing ${audioToProcess.length} bytes of audio`
       );
-      const transcription = await this.sttProvider.transcribe(wavBuffer, {
-        language: this.LANGUAGE
-      });
+      let transcription: string;
+      try {
+        transcription = await this.sttProvider.transcribe(audioToProcess, {
+          language: this.LANGUAGE,
+          sampleRate: this.SAMPLE_RATE
+        });
+      } finally {
+        release();
+      }
 
       if (!transcription || transcription.trim() === '') {
         console.log(`[VoiceAgentPipeline:${this.callId}] Empty transcription`);
-        this.isProcessing = false;
         return;
       }
 
@@ -239,135 +353,346 @@ Sprich auf Deutsch.`;
         timestamp: new Date()
       });
 
-      // In listen-only mode, skip LLM and TTS
-      if (this.options.listenOnlyMode) {
-        this.isProcessing = false;
+      // In listen-only mode (or once the call is over), skip LLM and TTS
+      if (this.options.listenOnlyMode || this.isStopped) {
         return;
       }
 
       // Interactive mode: Continue with LLM and TTS
-      this.conversationHistory.push({ role: 'user', content: transcription });
+      const userText = cleanTurn(transcription);
+      if (!userText) {
+        console.log(`[VoiceAgentPipeline:${this.callId}] Only filler words, no response`);
+        return;
+      }
+      this.conversationHistory.push({ role: 'user', content: userText });
 
-      // Get LLM response
-      const response = await this.llmProvider.chat(this.conversationHistory);
-      console.log(`[VoiceAgentPipeline:${this.callId}] Agent responds: ${response}`);
-      this.conversationHistory.push({ role: 'assistant', content: response });
+      // Stream LLM response and speak each sentence as soon as it is complete
+      await this.speakSentences(this.streamResponse());
 
-      // Emit event when agent responds (before speaking)
-      this.emit('agentResponse', {
-        callId: this.callId,
-        speaker: this.options.speakerLabel || 'assistant',
-        text: response,
-        timestamp: new Date()
-      });
-
-      // Speak response
-      await this.speak(response);
+      // Keep the prompt short for the next turns (runs in the background)
+      this.compactHistory();
     } catch (error) {
       console.error(`[VoiceAgentPipeline:${this.callId}] Error processing audio:`, error);
     } finally {
       this.isProcessing = false;
+
+      // Continue with speech that arrived while this turn was in flight
+      const pending = this.pendingUtterance;
+      this.pendingUtterance = null;
+      if (pending && !this.isStopped) {
+        this.startTurn(pending);
+      }
     }
   }
 
   /**
-   * Generate speech and send via RTP
+   * Stream the LLM response as complete sentences
+   * Records the (possibly interrupted) response in the history once done
+   */
+  private async *streamResponse(): AsyncGenerator<string> {
+    let response = '';
+
+    try {
+      if (this.llmProvider.chatStream) {
+        let pending = '';
+        for await (const delta of this.llmProvider.chatStream(this.conversationHistory)) {
+          response += delta;
+          pending += delta;
+
+          // Everything before the last boundary is a complete sentence
+          const parts = pending.split(SENTENCE_BOUNDARY);
+          pending = parts.pop() ?? '';
+          for (const part of parts) {
+            const sentence = part.trim();
+            if (sentence) yield sentence;
+          }
+        }
+
+        if (pending.trim()) {
+          yield pending.trim();
+        }
+      } else {
+        response = await this.llmProvider.chat(this.conversationHistory);
+        yield* splitSentences(response);
+      }
+    } finally {
+      if (response) {
+        console.log(`[VoiceAgentPipeline:${this.callId}] Agent responds: ${response}`);
+        if (!this.isStopped) {
+          this.conversationHistory.push({ role: 'assistant', content: cleanTurn(response) });
+        }
+
+        // Emit event once the full response is known (also when the call ended meanwhile, for the transcript)
+        this.emit('agentResponse', {
+          callId: this.callId,
+          speaker: this.options.speakerLabel || 'assistant',
+          text: response,
+          timestamp: new Date()
+        });
+      }
+    }
+  }
+
+  /**
+   * Summarize older turns so the prompt stays bounded
+   *
+   * The history is kept as [system prompt, summary?, ...last MAX_TURNS messages].
+   * The system prompt stays first and unchanged so OpenAI prompt caching keeps
+   * working. Once SUMMARY_EVERY messages have fallen out of the recent window,
+   * they are merged with the previous summary into one system message.
+   */
+  private async compactHistory(): Promise<void> {
+    if (this.isSummarizing || this.isStopped) {
+      return;
+    }
+
+    const start = this.historySummary ? 2 : 1;
+    const older = this.conversationHistory.slice(start, -this.MAX_TURNS);
+    if (older.length < this.SUMMARY_EVERY) {
+      return;
+    }
+
+    this.isSummarizing = true;
+    try {
+      const transcript = older
+        .map((message) => `${message.role === 'user' ? 'Kunde' : 'Agent'}: ${message.content}`)
+        .join('\n');
+      const previous = this.historySummary ? `${this.historySummary.content}\n` : '';
+
+      const summary = await this.llmProvider.chat(
+        [{ role: 'user', content: `${previous}${transcript}` }],
+        { systemPrompt: SUMMARY_PROMPT, temperature: 0, maxTokens: 150 }
+      );
+
+      if (this.isStopped || !summary.trim()) {
+        return;
+      }
+
+      // New turns are only appended, so the summarized messages still directly follow the head
+      const summaryMessage: ChatMessage = {
+        role: 'system',
+        content: `Bisheriger Gesprächsverlauf: ${cleanTurn(summary)}`
+      };
+      this.conversationHistory.splice(1, start - 1 + older.length, summaryMessage);
+      this.historySummary = summaryMessage;
+
+      console.log(
+        `[VoiceAgentPipeline:${this.callId}] Summarized ${older.length} messages, history now ${this.conversationHistory.length} messages`
+      );
+    } catch (error) {
+      // Keep the full history, the next turn tries again
+      console.warn(`[VoiceAgentPipeline:${this.callId}] History summary failed:`, error);
+    } finally {
+      this.isSummarizing = false;
+    }
+  }
+
+  /**
+   * Generate speech for scripted text and send via RTP
+   * Scripted prompts repeat across calls, so their audio is cached
    */
   private async speak(text: string): Promise<void> {
+    await this.speakSentences(splitSentences(text), true);
+  }
+
+  /**
+   * Speak sentences in order as a small pipeline:
+   * synthesis of the next sentences overlaps playback of the current one
+   * @param cacheable - Store synthesized audio in the TTS cache (not used for LLM responses)
+   */
+  private async speakSentences(
+    sentences: Iterable<string> | AsyncIterable<string>,
+    cacheable: boolean = false
+  ): Promise<void> {
     if (this.isStopped) {
       console.warn(`[VoiceAgentPipeline:${this.callId}] Skipping speak: pipeline stopped`);
       return;
     }
 
-    const startedAt = Date.now();
+    this.shouldInterrupt = false;
+    const queues: PlaybackQueue[] = [];
+    const syntheses: Promise<void>[] = [];
+    let playback: Promise<void> = Promise.resolve();
 
     try {
-      console.log(`[VoiceAgentPipeline:${this.callId}] Generating speech for: ${text}`);
+      for await (const sentence of sentences) {
+        if (this.isStopped || this.shouldInterrupt) break;
 
-      // Generate TTS
-      const audioBuffer = await this.ttsProvider.synthesize(text, {
-        voice: 'nova',
-        language: this.LANGUAGE
-      });
+        // Limit lookahead so we don't synthesize far ahead of what is being played
+        if (queues.length >= this.MAX_TTS_LOOKAHEAD) {
+          await queues[queues.length - this.MAX_TTS_LOOKAHEAD].played;
+          if (this.isStopped || this.shouldInterrupt) break;
+        }
 
-      if (this.isStopped) {
-        console.warn(`[VoiceAgentPipeline:${this.callId}] Discarding speech: pipeline stopped`);
-        return;
-      }
+        console.log(`[VoiceAgentPipeline:${this.callId}] Generating speech for: ${sentence}`);
 
-      // Convert TTS output (likely MP3) to PCM 8kHz for RTP
-      const pcmAudio = await mp3ToPcm8k(audioBuffer);
+        const queue = new PlaybackQueue(this.FRAME_BYTES);
+        queues.push(queue);
+        syntheses.push(this.synthesizeInto(sentence, queue, cacheable));
 
-      // Clear any buffered audio BEFORE starting to speak
-      this.audioBuffer = Buffer.alloc(0);
+        playback = playback
+          .then(() => (this.isStopped || this.shouldInterrupt ? undefined : this.play(queue)))
+          .catch((error) => {
+            console.error(`[VoiceAgentPipeline:${this.callId}] Error playing speech:`, error);
+          })
+          .finally(() => queue.close());
+      }
+    } catch (error) {
+      console.error(`[VoiceAgentPipeline:${this.callId}] Error generating speech:`, error);
+    }
 
-      // NOW we start speaking and check for interrupts
-      this.speakingStartTime = Date.now();
-      this.isSpeaking = true;
-      this.shouldInterrupt = false;
+    try {
+      // Let already queued sentences finish playing
+      await Promise.all([playback, ...syntheses]);
+    } finally {
+      // If interrupted, the VAD emits the user's utterance once they stop talking
+      this.isSpeaking = false;
+      queues.forEach((queue) => queue.close());
+    }
+  }
+
+  /**
+   * Synthesize text and feed 8kHz PCM frames into the playback queue
+   * @param cacheable - Scripted text: served from and stored in the TTS cache
+   * (LLM sentences skip the lookup, a miss would cost a disk read on the reply path)
+   */
+  private async synthesizeInto(text: string, queue: PlaybackQueue, cacheable: boolean): Promise<void> {
+    const cache = getTTSCache();
+    const cacheKey = cacheable ? TTSCache.key(text, this.ttsProvider, TTS_OPTIONS) : '';
 
-      // Stream audio in chunks via RTP
-      const chunkSize = 320; // 20ms at 8kHz, 16-bit = 320 bytes
-      let offset = 0;
-      let packets = 0;
+    try {
+      const cached = cacheable ? await cache.get(cacheKey) : null;
+      if (cached) {
+        queue.push(cached);
+        return;
+      }
 
-      // Mark start of talkspurt so RTP sets marker bit
-      this.rtpHandler.setMarkerForNextPacket();
+      const pcmChunks: Buffer[] = [];
 
-      while (offset < pcmAudio.length) {
-        // Check for interrupts or stop
-        if (this.isStopped) {
-          console.warn(
-            `[VoiceAgentPipeline:${this.callId}] Stopping speech mid-playback: pipeline stopped`
-          );
-          break;
+      if (this.ttsProvider.synthesizeStream && this.ttsProvider.streamSampleRate) {
+        // Streaming PCM: no container decode, frames are playable as they arrive
+        const resample = createPcmResampler(this.ttsProvider.streamSampleRate, this.SAMPLE_RATE);
+        for await (const chunk of this.ttsProvider.synthesizeStream(text, TTS_OPTIONS)) {
+          if (queue.isClosed() || this.isStopped) return;
+          const pcm = resample(chunk);
+          queue.push(pcm);
+          if (cacheable) pcmChunks.push(pcm);
         }
+      } else {
+        // Convert TTS output (likely MP3) to PCM 8kHz for RTP
+        const audioBuffer = await this.ttsProvider.synthesize(text, TTS_OPTIONS);
+        const pcm = await mp3ToPcm8k(audioBuffer);
+        queue.push(pcm);
+        if (cacheable) pcmChunks.push(pcm);
+      }
 
-        if (this.shouldInterrupt) {
-          console.log(
-            `[VoiceAgentPipeline:${this.callId}] Speech interrupted after ${Date.now() - startedAt}ms`
-          );
-          break;
-        }
+      // Only complete synthesis results are cached (playback does not wait for the write)
+      if (cacheable) {
+        queue.end();
+        await cache.set(cacheKey, Buffer.concat(pcmChunks));
+      }
+    } catch (error) {
+      console.error(`[VoiceAgentPipeline:${this.callId}] Error generating speech:`, error);
+    } finally {
+      queue.end();
+    }
+  }
 
-        const chunk = pcmAudio.slice(offset, offset + chunkSize);
-        this.rtpHandler.sendAudio(chunk);
-        packets += 1;
+  /**
+   * Send queued frames via RTP in real time until drained, stopped or interrupted
+   * Frames are paced against an absolute clock derived from the number of samples
+   * sent, so timer jitter does not accumulate into drift or gaps.
+   * Resolves queue.played once the last frame is out.
+   */
+  private async play(queue: PlaybackQueue): Promise<void> {
+    let frame = await queue.nextFrame();
 
-        // Wait 20ms between chunks for real-time playback
-        await new Promise((resolve) => setTimeout(resolve, 20));
+    if (this.isStopped) {
+      console.warn(`[VoiceAgentPipeline:${this.callId}] Discarding speech: pipeline stopped`);
+      return;
+    }
+
+    if (!frame || this.shouldInterrupt) {
+      return;
+    }
 
-        offset += chunkSize;
+    // NOW we start speaking and check for interrupts
+    const startedAt = Date.now();
+    let clockStart = performance.now();
+    let clockFrames = 0;
+    if (!this.isSpeaking) {
+      this.speakingStartTime = startedAt;
+      this.isSpeaking = true;
+
+      // Mark start of talkspurt so RTP sets marker bit
+      this.rtpHandler.setMarkerForNextPacket();
+    }
+    let packets = 0;
+
+    while (frame) {
+      // Check for interrupts or stop
+      if (this.isStopped) {
+        console.warn(
+          `[VoiceAgentPipeline:${this.callId}] Stopping speech mid-playback: pipeline stopped`
+        );
+        return;
       }
 
-      if (!this.isStopped && !this.shouldInterrupt) {
+      if (this.shouldInterrupt) {
         console.log(
-          `[VoiceAgentPipeline:${this.callId}] Speech completed: ${packets} packets, ${Date.now() - startedAt}ms`
+          `[VoiceAgentPipeline:${this.callId}] Speech interrupted after ${Date.now() - this.speakingStartTime}ms`
         );
+        return;
       }
-    } catch (error) {
-      console.error(`[VoiceAgentPipeline:${this.callId}] Error generating speech:`, error);
-    } finally {
-      this.isSpeaking = false;
 
-      // If interrupted, process the buffered user audio immediately
-      if (this.shouldInterrupt && this.audioBuffer.length > 0) {
-        console.log(`[VoiceAgentPipeline:${this.callId}] Processing user input after interrupt`);
-        this.shouldInterrupt = false;
-        await new Promise((resolve) => setTimeout(resolve, 100));
-        this.processAudioBuffer();
+      this.rtpHandler.sendAudio(frame);
+      packets += 1;
+      clockFrames += 1;
+
+      // Wait until the audio sent so far has played (real-time playback)
+      const delayMs = clockStart + clockFrames * this.FRAME_MS - performance.now();
+      if (delayMs > 0) {
+        await new Promise((resolve) => setTimeout(resolve, delayMs));
+      }
+
+      frame = await queue.nextFrame();
+
+      // Waited for TTS longer than the clock allows: continue from now instead of bursting
+      if (performance.now() - (clockStart + clockFrames * this.FRAME_MS) > this.MAX_PLAYBACK_LAG_MS) {
+        clockStart = performance.now();
+        clockFrames = 0;
       }
     }
+
+    queue.markPlayed();
+    console.log(
+      `[VoiceAgentPipeline:${this.callId}] Speech completed: ${packets} packets (${packets * this.FRAME_MS}ms audio) in ${Date.now() - startedAt}ms`
+    );
   }
 
   /**
    * Stop the pipeline
    */
   async stop(): Promise<void> {
+    if (this.isStopped) return;
     console.log(`[VoiceAgentPipeline:${this.callId}] Stopping`);
     this.isStopped = true;
     this.rtpHandler.removeAllListeners('audio');
+    this.vadBuffer.removeAllListeners('utterance');
     this.conversationHistory = [];
-    this.audioBuffer = Buffer.alloc(0);
+    this.historySummary = null;
+    this.pendingUtterance = null;
+  }
+
+  /**
+   * Resolve once the turn in flight (and speech queued behind it) has finished
+   * Events of that turn are emitted before this resolves
+   */
+  async whenIdle(): Promise<void> {
+    let turn: Promise<void>;
+    do {
+      turn = this.currentTurn;
+      await turn;
+    } while (turn !== this.currentTurn);
   }
 }
@@ -7,7 +7,11 @@
 export { SIPServerService } from './SIPServerService';
 export { RTPAudioHandler } from './RTPAudioHandler';
 export { VADBuffer, type VADBufferOptions } from './VADBuffer';
+export { CaptureBufferPool } from './CaptureBufferPool';
 export { AudioMixer } from './AudioMixer';
+export { PlaybackQueue } from './PlaybackQueue';
+export { TTSCache, getTTSCache, synthesizePcm8k, type TTSCacheOptions } from './TTSCache';
+export { STTBatcher, getSTTBatcher, type STTBatcherOptions } from './STTBatcher';
 export { VoiceAgentPipeline, type VoicePipelineOptions } from './VoiceAgentPipeline';
 export {
   PassiveListenerPipeline,
@@ -15,11 +19,19 @@ export {
 } from './PassiveListenerPipeline';
 export {
   pcmToWav,
+  createWavHeader,
+  wavParts,
   wavToPcm,
+  pcmSamples,
+  samplesToPcm,
   mp3ToPcm8k,
   audioToPcm8k,
   resamplePcm,
+  createPcmResampler,
   getAudioDurationMs,
   calculateRms,
-  rmsToDb
+  rmsToDb,
+  energyZcr,
+  containsSpeech,
+  type SpeechGateOptions
 } from './AudioUtils';
@@ -0,0 +1,60 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { containsSpeech, energyZcr } from '../src/sip/AudioUtils';
+
+const SAMPLE_RATE = 8000;
+
+/**
+ * 16-bit PCM buffer of the given length, filled by a sample generator
+ */
+function pcm(durationMs: number, sample: (i: number) => number): Buffer {
+  const samples = new Int16Array((SAMPLE_RATE * durationMs) / 1000);
+  for (let i = 0; i < samples.length; i++) {
+    samples[i] = Math.round(sample(i));
+  }
+  return Buffer.from(samples.buffer);
+}
+
+// Sine with the given RMS level in dBFS
+const tone = (frequency: number, rmsDb: number) => (i: number) =>
+  32768 * Math.pow(10, rmsDb / 20) * Math.SQRT2 * Math.sin((2 * Math.PI * frequency * i) / SAMPLE_RATE);
+
+// Deterministic white noise with the given peak amplitude
+function noise(amplitude: number): (i: number) => number {
+  let seed = 1;
+  return () => {
+    seed = (seed * 16807) % 2147483647; // Park-Miller, exact in double precision
+    return (seed / 1073741823.5 - 1) * amplitude;
+  };
+}
+
+test('energyZcr returns mean square energy and sign changes', () => {
+  assert.deepEqual(energyZcr(new Int16Array([100, -100, 100, -100])), { meanSquare: 10000, zeroCrossings: 3 });
+  assert.deepEqual(energyZcr(new Int16Array(0)), { meanSquare: 0, zeroCrossings: 0 });
+});
+
+test('silence is not speech', () => {
+  assert.equal(containsSpeech(pcm(1000, () => 0)), false);
+});
+
+test('an isolated click is not speech', () => {
+  // 5ms at full scale inside one second of silence
+  assert.equal(containsSpeech(pcm(1000, (i) => (i >= 4000 && i < 4040 ? 30000 : 0))), false);
+});
+
+test('low-level broadband noise is not speech', () => {
+  // About -55 dBFS RMS with a high zero-crossing rate
+  assert.equal(containsSpeech(pcm(1000, noise(100))), false);
+});
+
+test('a voiced tone is speech', () => {
+  assert.equal(containsSpeech(pcm(500, tone(200, -24))), true);
+});
+
+test('the voiced level threshold follows minRmsDb', () => {
+  const quiet = pcm(500, tone(200, -44));
+
+  // Below the VAD default of -40 dBFS, above a more sensitive VAD setting
+  assert.equal(containsSpeech(quiet), false);
+  assert.equal(containsSpeech(quiet, { minRmsDb: -45 }), true);
+});
@@ -0,0 +1,35 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { FallbackSTTProvider } from '../src/providers/ai/stt/FallbackSTTProvider';
+import type { ISTTProvider } from '../src/providers/ai/ISTTProvider';
+
+const withWords = (name: string, word: string): ISTTProvider => ({
+  name,
+  transcribe: async () => word,
+  transcribeWords: async () => [{ word, start: 0, end: 0.5 }]
+});
+
+const withoutWords = (name: string): ISTTProvider => ({
+  name,
+  transcribe: async () => name
+});
+
+test('word timestamps are only offered if both providers support them', () => {
+  assert.equal(new FallbackSTTProvider(withWords('local', 'a'), withoutWords('openai')).transcribeWords, undefined);
+  assert.equal(new FallbackSTTProvider(withoutWords('local'), withWords('openai', 'a')).transcribeWords, undefined);
+  assert.equal(typeof new FallbackSTTProvider(withWords('local', 'a'), withWords('openai', 'b')).transcribeWords, 'function');
+});
+
+test('word timestamps fall back when the primary fails', async () => {
+  const primary: ISTTProvider = {
+    ...withWords('local', 'a'),
+    transcribeWords: async () => {
+      throw new Error('down');
+    }
+  };
+  const provider = new FallbackSTTProvider(primary, withWords('openai', 'b'));
+
+  assert.deepEqual(await provider.transcribeWords!(Buffer.alloc(0), { language: 'de' }), [
+    { word: 'b', start: 0, end: 0.5 }
+  ]);
+});
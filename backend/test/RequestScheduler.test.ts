@@ -0,0 +1,102 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import OpenAI from 'openai';
+import { RequestScheduler } from '../src/providers/ai/RequestScheduler';
+
+test('scheduler without limits runs requests immediately', { timeout: 1000 }, async () => {
+  const scheduler = new RequestScheduler();
+
+  assert.equal(await scheduler.submit(async () => 'first', 500), 'first');
+  assert.equal(await scheduler.submit(async () => 'second'), 'second');
+});
+
+test('scheduler with limits runs requests within the budget immediately', { timeout: 1000 }, async () => {
+  const scheduler = new RequestScheduler({ requestsPerMinute: 60, tokensPerMinute: 1000 });
+
+  assert.equal(await scheduler.submit(async () => 'ok', 500), 'ok');
+});
+
+// Retries without noticeable backoff
+const fastRetries = { minRetryDelayMs: 1, maxRetryDelayMs: 1 };
+
+/**
+ * Task failing with the given error on its first call, counting calls
+ */
+function failingOnce(error: unknown) {
+  const task = async () => {
+    task.calls++;
+    if (task.calls === 1) throw error;
+    return 'ok';
+  };
+  task.calls = 0;
+  return task;
+}
+
+test('rate limit, connection, server, 408 and 409 errors are retried', async () => {
+  const retryable = [
+    new OpenAI.RateLimitError(429, undefined, 'rate limited', undefined),
+    new OpenAI.APIConnectionError({ message: 'connection reset' }),
+    new OpenAI.InternalServerError(500, undefined, 'server error', undefined),
+    new OpenAI.APIError(408, undefined, 'request timeout', undefined),
+    new OpenAI.ConflictError(409, undefined, 'conflict', undefined)
+  ];
+
+  for (const error of retryable) {
+    const task = failingOnce(error);
+    assert.equal(await new RequestScheduler(fastRetries).submit(task), 'ok');
+    assert.equal(task.calls, 2, error.message);
+  }
+});
+
+test('client errors are not retried', async () => {
+  const scheduler = new RequestScheduler(fastRetries);
+
+  for (const error of [new OpenAI.BadRequestError(400, undefined, 'bad request', undefined), new Error('bug')]) {
+    const task = failingOnce(error);
+    await assert.rejects(scheduler.submit(task), error);
+    assert.equal(task.calls, 1);
+  }
+});
+
+test('retries stop after maxAttempts', async () => {
+  const error = new OpenAI.RateLimitError(429, undefined, 'rate limited', undefined);
+  let calls = 0;
+  const scheduler = new RequestScheduler({ ...fastRetries, maxAttempts: 3 });
+
+  await assert.rejects(
+    scheduler.submit(async () => {
+      calls++;
+      throw error;
+    }),
+    error
+  );
+  assert.equal(calls, 3);
+});
+
+test('no more than maxConcurrency requests run at once', async () => {
+  const scheduler = new RequestScheduler({ maxConcurrency: 2 });
+  let active = 0;
+  let maxActive = 0;
+
+  const task = async () => {
+    active++;
+    maxActive = Math.max(maxActive, active);
+    await new Promise((resolve) => setTimeout(resolve, 10));
+    active--;
+  };
+  await Promise.all(Array.from({ length: 5 }, () => scheduler.submit(task)));
+
+  assert.equal(maxActive, 2);
+  assert.deepEqual(scheduler.getStats(), { active: 0, queued: 0 });
+});
+
+test('requests wait for the token bucket to refill', { timeout: 1000 }, async () => {
+  // 1000 tokens per second, the first request empties the bucket
+  const scheduler = new RequestScheduler({ tokensPerMinute: 60000 });
+  await scheduler.submit(async () => undefined, 60000);
+
+  const startedAt = Date.now();
+  await scheduler.submit(async () => undefined, 100);
+
+  assert.ok(Date.now() - startedAt >= 90, `waited ${Date.now() - startedAt}ms`);
+});
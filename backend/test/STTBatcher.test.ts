@@ -0,0 +1,55 @@
+import { test } from 'node:test';
+import assert from 'node:assert/strict';
+import { STTBatcher } from '../src/sip/STTBatcher';
+import type { ISTTProvider } from '../src/providers/ai/ISTTProvider';
+import type { TranscribedWord } from '../src/providers/ai/IAIProvider';
+
+// 1s of 8kHz 16-bit PCM
+const second = () => Buffer.alloc(16000);
+
+test('utterances within the window are joined and split back by word timestamps', async () => {
+  const requests: number[] = [];
+  const provider: ISTTProvider = {
+    name: 'fake',
+    transcribe: async () => assert.fail('expected one joined request'),
+    transcribeWords: async (audio): Promise<TranscribedWord[]> => {
+      requests.push(audio.length);
+      // Utterances at 0-1s and 1.5-2.5s (500ms gap)
+      return [
+        { word: 'Guten', start: 0.1, end: 0.4 },
+        { word: 'Tag', start: 0.5, end: 0.9 },
+        { word: 'Hallo', start: 1.6, end: 2.0 }
+      ];
+    }
+  };
+  const batcher = new STTBatcher(provider, { windowMs: 10, gapMs: 500 });
+
+  const texts = await Promise.all([batcher.transcribe(second(), 'de'), batcher.transcribe(second(), 'de')]);
+
+  assert.deepEqual(texts, ['Guten Tag', 'Hallo']);
+  assert.deepEqual(requests, [16000 + 8000 + 16000]);
+});
+
+test('without word timestamps every utterance is its own request', async () => {
+  let requests = 0;
+  const provider: ISTTProvider = {
+    name: 'fake',
+    transcribe: async () => `text ${++requests}`
+  };
+  const batcher = new STTBatcher(provider, { windowMs: 10 });
+
+  const texts = await Promise.all([batcher.transcribe(second(), 'de'), batcher.transcribe(second(), 'de')]);
+
+  assert.equal(requests, 2);
+  assert.deepEqual([...texts].sort(), ['text 1', 'text 2']);
+});
+
+test('a full batch is dispatched without waiting for the window', { timeout: 1000 }, async () => {
+  const provider: ISTTProvider = {
+    name: 'fake',
+    transcribe: async () => 'text'
+  };
+  const batcher = new STTBatcher(provider, { windowMs: 60000, maxBatchSize: 1 });
+
+  assert.equal(await batcher.transcribe(second(), 'de'), 'text');
+});